@@ -0,0 +1,6 @@
+"""Quality assurance examples."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["unit_testing"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
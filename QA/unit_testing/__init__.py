@@ -0,0 +1,6 @@
+"""unittest examples."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["unit_testing_example"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,6 @@
+"""Core Python concepts: REST APIs, concurrency and data structures."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["api_rest", "concurrency", "data_structures"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
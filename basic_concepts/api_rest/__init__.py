@@ -0,0 +1,6 @@
+"""REST API examples: a reference server, a load test and *args/**kwargs."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["args_kwargs", "rest_load_test", "rest_server_example"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,6 @@
+"""*args/**kwargs basics and a signature binder that checks them once."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["args_kwargs_example", "kwargs_binder_example"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
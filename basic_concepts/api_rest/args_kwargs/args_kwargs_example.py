@@ -22,29 +22,6 @@ def print_all(*args, **kwargs):
 	print("Positional arguments:", args)
 	print("Keyword arguments:", kwargs)
 
-if __name__ == "__main__":
-	print("--- Example: *args ---")
-	print_args(1, 2, 3)
-	# Output:
-	# Arguments received (as tuple): (1, 2, 3)
-	# 1
-	# 2
-	# 3
-
-	print("\n--- Example: **kwargs ---")
-	print_kwargs(name="Alice", age=30)
-	# Output:
-	# Keyword arguments received (as dict): {'name': 'Alice', 'age': 30}
-	# name: Alice
-	# age: 30
-
-	print("\n--- Example: *args and **kwargs together ---")
-	print_all(1, 2, name="Bob", job="Engineer")
-	# Output:
-	# Positional arguments: (1, 2)
-	# Keyword arguments: {'name': 'Bob', 'job': 'Engineer'}
-
-
 # === Summary ===
 #
 # *args is used when you want to accept a variable number of positional arguments.
@@ -63,24 +40,47 @@ if __name__ == "__main__":
 def sum_all(*args):
 	return sum(args)
 
-print("\n--- Scenario: *args for summing numbers ---")
-print(sum_all(1, 2, 3))      # 6
-print(sum_all(5, 10, 15, 20)) # 50
-
 # 2. **kwargs: When you want to build a dictionary from named arguments
 def build_profile(**kwargs):
 	return kwargs
 
-print("\n--- Scenario: **kwargs for building a profile ---")
-print(build_profile(name="Alice", age=30, job="Engineer"))
-# {'name': 'Alice', 'age': 30, 'job': 'Engineer'}
-
 # 3. *args and **kwargs: When you want to accept both types of arguments
 def flexible_function(*args, **kwargs):
 	print("Positional:", args)
 	print("Keyword:", kwargs)
 
-print("\n--- Scenario: *args and **kwargs together ---")
-flexible_function(1, 2, 3, a=10, b=20)
-# Positional: (1, 2, 3)
-# Keyword: {'a': 10, 'b': 20}
+
+if __name__ == "__main__":
+	print("--- Example: *args ---")
+	print_args(1, 2, 3)
+	# Output:
+	# Arguments received (as tuple): (1, 2, 3)
+	# 1
+	# 2
+	# 3
+
+	print("\n--- Example: **kwargs ---")
+	print_kwargs(name="Alice", age=30)
+	# Output:
+	# Keyword arguments received (as dict): {'name': 'Alice', 'age': 30}
+	# name: Alice
+	# age: 30
+
+	print("\n--- Example: *args and **kwargs together ---")
+	print_all(1, 2, name="Bob", job="Engineer")
+	# Output:
+	# Positional arguments: (1, 2)
+	# Keyword arguments: {'name': 'Bob', 'job': 'Engineer'}
+
+	print("\n--- Scenario: *args for summing numbers ---")
+	print(sum_all(1, 2, 3))      # 6
+	print(sum_all(5, 10, 15, 20)) # 50
+
+	print("\n--- Scenario: **kwargs for building a profile ---")
+	print(build_profile(name="Alice", age=30, job="Engineer"))
+	# {'name': 'Alice', 'age': 30, 'job': 'Engineer'}
+
+	print("\n--- Scenario: *args and **kwargs together ---")
+	flexible_function(1, 2, 3, a=10, b=20)
+	# Positional: (1, 2, 3)
+	# Keyword: {'a': 10, 'b': 20}
@@ -0,0 +1,138 @@
+"""
+REST Load Test Concept:
+Drives rest_server_example.py on localhost to measure what _api_rest.txt claims:
+
+1. Offset vs cursor pagination at deep pages: GET /api/users?page=N&limit=20 has to skip
+   (N - 1) * 20 rows, GET /api/users?cursor=...&limit=20 binary-searches the keyset index.
+   With a filter (&role=user) every skipped row is also checked, and "total" needs a
+   COUNT over all matching rows - the case where deep offsets really hurt. All requests
+   send "Cache-Control: no-cache" so the server's response cache doesn't hide the
+   difference.
+2. Keep-alive connection pooling vs a new TCP connection per request.
+3. ETag revalidation (304 Not Modified) and the server's LRU response cache vs rendering
+   every response.
+
+Usage: python rest_load_test.py [users]   (default 200,000 users)
+   or: python -m basic_concepts.api_rest.rest_load_test [users]
+"""
+
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .rest_server_example import UsersClient, UsersServer, encode_cursor, seed_store
+except ImportError:  # run as a script: python rest_load_test.py
+    from rest_server_example import UsersClient, UsersServer, encode_cursor, seed_store
+
+LIMIT = 20
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))]
+    return statistics.fmean(samples), pick(0.50), pick(0.99)
+
+
+def time_requests(client, paths, repeat=20, **headers):
+    """Latency samples in ms for each request in paths, repeated"""
+    samples = []
+    for _ in range(repeat):
+        for path in paths:
+            start = time.perf_counter()
+            status, _, _ = client.get(path, **headers)
+            samples.append((time.perf_counter() - start) * 1000)
+            assert status == 200, (status, path)
+    return samples
+
+
+def compare_pagination(client, total_users, role=None, pages=(1, 100, 1_000, 5_000, 9_000)):
+    query = f"limit={LIMIT}" + (f"&role={role}" if role else "")
+    print(f"--- Offset vs cursor pagination ({total_users:,} users, {query}) ---")
+    print(f"{'page':>7} {'offset mean':>12} {'offset p99':>11} {'cursor mean':>12} {'cursor p99':>11}")
+    no_cache = {"Cache-Control": "no-cache"}
+    for page in pages:
+        offset_path = f"/api/users?page={page}&{query}"
+        _, by_offset, _ = client.get(offset_path, **no_cache)
+        if not by_offset["data"]:
+            break
+        # The cursor a client would hold after reading the previous pages: rows between
+        # it and the first row of this page don't match the filter, so any id in that gap works
+        cursor_path = f"/api/users?cursor={encode_cursor(by_offset['data'][0]['id'] - 1)}&{query}"
+        _, by_cursor, _ = client.get(cursor_path, **no_cache)
+        assert by_offset["data"] == by_cursor["data"]
+        offset = _percentiles(time_requests(client, [offset_path], **no_cache))
+        cursor = _percentiles(time_requests(client, [cursor_path], **no_cache))
+        print(f"{page:>7,} {offset[0]:>10.2f}ms {offset[2]:>9.2f}ms {cursor[0]:>10.2f}ms {cursor[2]:>9.2f}ms")
+
+
+def compare_connections(port, requests=2_000, threads=8):
+    print(f"\n--- Keep-alive pool vs new connection per request ({requests:,} requests, {threads} threads) ---")
+    for label, keep_alive in [("new connection", False), ("keep-alive pool", True)]:
+        client = UsersClient(port=port, pool_size=threads, keep_alive=keep_alive, etag_cache=False)
+        paths = [f"/api/users/{i % 1000 + 1}" for i in range(requests)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(client.get, paths))
+        elapsed = time.perf_counter() - start
+        print(f"{label:18} {requests / elapsed:10,.0f} req/s  ({client.connections_opened:,} connections opened)")
+        client.close()
+
+
+def compare_caching(server, requests=500):
+    print(f"\n--- Response caching on a 100-row page ({requests} requests) ---")
+    path = "/api/users?page=50&limit=100"
+    cases = [
+        ("no cache (render every time)", dict(etag_cache=False), {"Cache-Control": "no-cache"}),
+        ("server LRU cache", dict(etag_cache=False), {}),
+        ("ETag revalidation (304)", dict(etag_cache=True), {}),
+    ]
+    for label, options, headers in cases:
+        client = UsersClient(port=server.port, **options)
+        client.get(path)  # warm up the connection and both caches
+        mean, p50, p99 = _percentiles(time_requests(client, [path], repeat=requests, **headers))
+        print(f"{label:30} mean {mean:6.3f}ms  p50 {p50:6.3f}ms  p99 {p99:6.3f}ms  (304s: {client.not_modified})")
+        client.close()
+    print(f"server cache hits/misses: {server.cache.hits}/{server.cache.misses}")
+
+
+def run_load_test(total_users=200_000):
+    start = time.perf_counter()
+    server = UsersServer(store=seed_store(total_users)).start_background()
+    print(f"Seeded {total_users:,} users in {time.perf_counter() - start:.2f}s, "
+          f"serving on port {server.port}\n")
+    client = UsersClient(port=server.port, etag_cache=False)  # measure full responses
+    try:
+        compare_pagination(client, total_users)
+        print()
+        compare_pagination(client, total_users, role="user")
+        compare_connections(server.port)
+        compare_caching(server)
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    run_load_test(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
+
+"""
+USEFUL LOAD TESTING TOOLS AND EXAMPLES:
+
+Standard Library:
+- time.perf_counter(): Per-request latency
+- statistics.fmean / sorted samples: Mean and percentiles (p50, p99)
+- concurrent.futures.ThreadPoolExecutor: Concurrent clients (I/O bound, so threads are fine)
+
+External Tools:
+- wrk / wrk2: wrk -t4 -c64 -d30s "http://127.0.0.1:8000/api/users?page=5000&limit=20"
+- hey, ab (ApacheBench), k6, locust: Scripted scenarios and reports
+
+Notes:
+- Look at p99, not only the mean: deep offset pages are the slow tail of real APIs
+- Warm up before measuring (connections, caches)
+- A localhost test measures the server, not the network: add latency (tc netem) to
+  see how much keep-alive and 304s save in practice
+"""
@@ -0,0 +1,461 @@
+"""
+Reference REST Server Concept:
+_api_rest.txt describes offset vs cursor pagination, ETag cache validation and
+application-level caching. This file implements them with the standard library only, so
+their effect can be measured on localhost (see rest_load_test.py):
+
+Server (http.server.ThreadingHTTPServer, HTTP/1.1 keep-alive):
+- GET  /api/users?page=2&limit=20          offset pagination
+- GET  /api/users?cursor=eyJpZCI6MTIzfQ&limit=20   cursor (keyset) pagination
+- GET  /api/users?role=admin&...            filter (WHERE role = ?), works with both
+- GET  /api/users/123                       single user
+- POST /api/users                           create (201 + Location)
+
+- UsersStore keeps users in id order with a keyset index (sorted list of ids + bisect).
+  A cursor is just the last id seen, base64-encoded, so the next page starts with an
+  O(log n) binary search. Offset pagination has to walk past `offset` rows first, which is
+  what SQL's OFFSET does too - deep pages get slower and slower.
+- Every response carries an ETag derived from the store's version. A client that sends
+  If-None-Match with the current ETag gets 304 Not Modified with no body.
+- Rendered responses are kept in an LRU cache keyed by (version, path), so repeated
+  requests skip JSON serialization. Writes bump the version, which invalidates everything
+  at once without scanning the cache. Requests with "Cache-Control: no-cache" bypass it.
+
+Client (UsersClient): a pool of keep-alive http.client connections, shared by threads,
+plus an ETag cache that revalidates instead of re-downloading.
+"""
+
+import base64
+import binascii
+import http.client
+import json
+import queue
+import threading
+import traceback
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+
+MAX_LIMIT = 100
+
+
+class ApiError(Exception):
+    """Error that maps to an HTTP status and the JSON error format from _api_rest.txt"""
+
+    def __init__(self, status, code, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+        self.headers = headers or {}
+
+
+# === STORE WITH KEYSET INDEX ===
+def encode_cursor(last_id):
+    return base64.urlsafe_b64encode(json.dumps({"id": last_id}, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded))["id"])
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise ApiError(400, "INVALID_REQUEST", f"Invalid cursor: {cursor!r}") from None
+
+
+class UsersStore:
+    """In-memory users ordered by id, with a sorted id index for keyset pagination"""
+
+    def __init__(self):
+        self._users = {}      # id -> user dict, insertion (= id) order
+        self._ids = []        # keyset index: sorted ids
+        self._lock = threading.Lock()
+        self.version = 0      # bumped on every write; drives ETags and cache keys
+
+    def __len__(self):
+        return len(self._ids)
+
+    def create(self, name, email, role="user"):
+        with self._lock:
+            user_id = self._ids[-1] + 1 if self._ids else 1
+            user = {"id": user_id, "name": name, "email": email, "role": role}
+            self._users[user_id] = user
+            self._ids.append(user_id)  # ids are increasing, so the index stays sorted
+            self.version += 1
+            return user
+
+    def get(self, user_id):
+        return self._users.get(user_id)
+
+    def _matching(self, rows, role):
+        return rows if role is None else (user for user in rows if user["role"] == role)
+
+    def page_by_offset(self, page, limit, role=None):
+        """
+        Like SQL OFFSET: walk past (page - 1) * limit matching rows, then take limit.
+        "total" is a COUNT(*) over the filter, another full pass when filtering.
+        """
+        offset = (page - 1) * limit
+        # Iterating the dict would fail if a POST added a user meanwhile; the id index is
+        # append-only, so its first `count` entries are a consistent snapshot
+        with self._lock:
+            count = len(self._ids)
+        ids, users = self._ids, self._users
+        snapshot = lambda: (users[ids[i]] for i in range(count))
+        rows = list(islice(self._matching(snapshot(), role), offset, offset + limit))
+        total = count if role is None else sum(1 for _ in self._matching(snapshot(), role))
+        return rows, {
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "pages": -(-total // limit),
+            "has_next": offset + limit < total,
+            "has_previous": page > 1,
+        }
+
+    def page_by_cursor(self, cursor, limit, role=None):
+        """Keyset pagination: binary search for the first id after the cursor, then scan forward"""
+        ids, users = self._ids, self._users
+        start = bisect_right(ids, decode_cursor(cursor)) if cursor else 0
+        # One row past the limit tells us whether there is a next page
+        # (islice(ids, start, None) would step through the first `start` ids one by one)
+        candidates = (users[ids[i]] for i in range(start, len(ids)))
+        rows = list(islice(self._matching(candidates, role), limit + 1))
+        has_next = len(rows) > limit
+        del rows[limit:]
+        return rows, {
+            "next_cursor": encode_cursor(rows[-1]["id"]) if has_next else None,
+            "has_next": has_next,
+            "limit": limit,
+        }
+
+
+# === LRU RESPONSE CACHE ===
+class ResponseCache:
+    """LRU cache of rendered response bodies; thread-safe"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# === SERVER ===
+class UsersRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: several requests per TCP connection
+    server_version = "UsersReference/1.0"
+    # Headers and body are separate small writes; with Nagle's algorithm on, the body
+    # waits for the client's delayed ACK (~40ms) on every keep-alive response
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass  # access logs would dominate a load test
+
+    def do_GET(self):
+        self._handle(self._get)
+
+    def do_POST(self):
+        self._handle(self._post)
+
+    def _handle(self, route):
+        try:
+            status, body, headers = route()
+        except ApiError as e:
+            status, headers = e.status, e.headers
+            body = json.dumps({"error": {"code": e.code, "message": e.message}}).encode()
+        except Exception:
+            # Still answer, or the client waits for a response that never comes; the
+            # request body may be unread, so the connection can't be reused
+            traceback.print_exc()
+            status, headers = 500, {"Connection": "close"}
+            body = json.dumps({"error": {"code": "INTERNAL_ERROR", "message": "Internal server error"}}).encode()
+        self._send(status, body, headers)
+
+    def _get(self):
+        store, cache = self.server.store, self.server.cache
+        url = urlsplit(self.path)
+        # The ETag only depends on the data version and the URL, so a conditional
+        # request can be answered before doing any work at all
+        etag = f'"{store.version:x}-{zlib.crc32(self.path.encode()):x}"'
+        if self.headers.get("If-None-Match") == etag:
+            return 304, b"", {"ETag": etag}
+
+        use_cache = "no-cache" not in self.headers.get("Cache-Control", "")
+        key = (store.version, self.path)
+        cached = cache.get(key) if use_cache else None
+        if cached is not None:
+            return 200, cached, {"ETag": etag, "X-Cache": "HIT"}
+
+        body = json.dumps(self._render(url)).encode()
+        if use_cache:
+            cache.put(key, body)
+        return 200, body, {"ETag": etag, "X-Cache": "MISS"}
+
+    def _render(self, url):
+        store = self.server.store
+        parts = url.path.rstrip("/").split("/")
+        if parts[:3] != ["", "api", "users"] or len(parts) > 4:
+            raise ApiError(404, "RESOURCE_NOT_FOUND", f"No route for {url.path}")
+        if len(parts) == 4:
+            user = store.get(_int_param(parts[3], "id"))
+            if user is None:
+                raise ApiError(404, "RESOURCE_NOT_FOUND", f"User with ID {parts[3]} not found")
+            return user
+
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        limit = _int_param(query.get("limit", "20"), "limit")
+        role = query.get("role")
+        if not 1 <= limit <= MAX_LIMIT:
+            raise ApiError(400, "INVALID_REQUEST", f"limit must be between 1 and {MAX_LIMIT}")
+        if "page" in query:
+            page = _int_param(query["page"], "page")
+            if page < 1:
+                raise ApiError(400, "INVALID_REQUEST", "page must be >= 1")
+            rows, pagination = store.page_by_offset(page, limit, role)
+        else:
+            rows, pagination = store.page_by_cursor(query.get("cursor"), limit, role)
+        return {"data": rows, "pagination": pagination}
+
+    def _post(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True  # the body can't be skipped without its length
+            raise ApiError(400, "INVALID_REQUEST", "Content-Length must be a non-negative integer")
+        # Read the body before any other error: left unread on a keep-alive connection,
+        # it would be parsed as the next request
+        body = self.rfile.read(length)
+        path = urlsplit(self.path).path.rstrip("/")
+        if path != "/api/users":
+            if not path.startswith("/api/users/"):
+                raise ApiError(404, "RESOURCE_NOT_FOUND", f"No route for {path}")
+            # /api/users/<id> exists but is read-only
+            raise ApiError(405, "METHOD_NOT_ALLOWED", f"POST not supported on {self.path}",
+                           {"Allow": "GET"})
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            raise ApiError(400, "INVALID_REQUEST", "Request body must be JSON") from None
+        if not isinstance(payload, dict):
+            raise ApiError(400, "INVALID_REQUEST", "Request body must be a JSON object")
+        missing = [field for field in ("name", "email") if not payload.get(field)]
+        if missing:
+            raise ApiError(422, "VALIDATION_ERROR", f"Missing fields: {missing}")
+        user = self.server.store.create(payload["name"], payload["email"], payload.get("role", "user"))
+        return 201, json.dumps(user).encode(), {"Location": f"/api/users/{user['id']}"}
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")  # clients may cache but must revalidate
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+def _int_param(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, "INVALID_REQUEST", f"{name} must be an integer") from None
+
+
+class UsersServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), store=None, cache_entries=1024):
+        super().__init__(address, UsersRequestHandler)
+        self.store = store if store is not None else UsersStore()
+        self.cache = ResponseCache(cache_entries)
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start_background(self):
+        """Serve from a daemon thread; returns self (call shutdown() to stop)"""
+        threading.Thread(target=self.serve_forever, name="UsersServer", daemon=True).start()
+        return self
+
+
+def seed_store(count):
+    """count users; every 10th one is an admin"""
+    store = UsersStore()
+    for i in range(1, count + 1):
+        store.create(f"User {i}", f"user{i}@example.com", "admin" if i % 10 == 0 else "user")
+    return store
+
+
+# === CLIENT ===
+class UsersClient:
+    """
+    Thread-safe client with a keep-alive connection pool and ETag revalidation.
+
+    Args:
+        host, port: Server address.
+        pool_size: Idle connections kept for reuse.
+        keep_alive: False opens a new TCP connection per request (for comparison).
+        etag_cache: Remember ETag + body per path and send If-None-Match.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8000, pool_size=8, keep_alive=True, etag_cache=True):
+        self.host = host
+        self.port = port
+        self.keep_alive = keep_alive
+        self._pool = queue.LifoQueue(pool_size)
+        self._etags = {} if etag_cache else None
+        self.connections_opened = 0
+        self.not_modified = 0
+
+    def _connection(self):
+        if self.keep_alive:
+            try:
+                return self._pool.get_nowait()
+            except queue.Empty:
+                pass
+        self.connections_opened += 1
+        return http.client.HTTPConnection(self.host, self.port, timeout=10)
+
+    def _release(self, conn):
+        if not self.keep_alive:
+            conn.close()
+            return
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(self, method, path, body=None, headers=None):
+        """Send a request; returns (status, parsed JSON body or None, response headers)"""
+        headers = dict(headers or {})
+        cached = self._etags.get(path) if self._etags is not None and method == "GET" else None
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+        if body is not None:
+            body = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        conn = self._connection()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()  # stale keep-alive connection; don't put it back
+            raise
+        self._release(conn)
+
+        if response.status == 304 and cached is not None:
+            self.not_modified += 1
+            return 200, cached[1], dict(response.getheaders())
+        payload = json.loads(data) if data else None
+        etag = response.getheader("ETag")
+        if self._etags is not None and method == "GET" and response.status == 200 and etag:
+            self._etags[path] = (etag, payload)
+        return response.status, payload, dict(response.getheaders())
+
+    def get(self, path, **headers):
+        return self.request("GET", path, headers=headers)
+
+    def create_user(self, name, email, role="user"):
+        return self.request("POST", "/api/users", body={"name": name, "email": email, "role": role})
+
+    def iter_users(self, limit=MAX_LIMIT):
+        """Iterate over all users by following next_cursor links"""
+        cursor = None
+        while True:
+            path = f"/api/users?limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+            status, payload, _ = self.get(path)
+            if status != 200:
+                raise ApiError(status, payload["error"]["code"], payload["error"]["message"])
+            yield from payload["data"]
+            cursor = payload["pagination"]["next_cursor"]
+            if not cursor:
+                return
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+if __name__ == "__main__":
+    server = UsersServer(store=seed_store(50)).start_background()
+    client = UsersClient(port=server.port)
+    print(f"Serving on http://127.0.0.1:{server.port}/api/users")
+
+    print("\n--- Cursor pagination ---")
+    status, page, _ = client.get("/api/users?limit=3")
+    print(status, [u["id"] for u in page["data"]], page["pagination"])
+    status, page, _ = client.get(f"/api/users?limit=3&cursor={page['pagination']['next_cursor']}")
+    print(status, [u["id"] for u in page["data"]])  # [4, 5, 6]
+
+    print("\n--- Offset pagination ---")
+    status, page, _ = client.get("/api/users?page=2&limit=20")
+    print(status, page["pagination"])
+    status, page, _ = client.get("/api/users?role=admin&limit=3")
+    print(status, [u["id"] for u in page["data"]])  # [10, 20, 30]
+
+    print("\n--- ETag revalidation ---")
+    client.get("/api/users/7")
+    status, user, headers = client.get("/api/users/7")
+    print(f"{user['name']} (304 responses so far: {client.not_modified})")  # 1
+    client.create_user("New User", "new@example.com")  # bumps the version -> new ETag
+    client.get("/api/users/7")
+    print(f"after a write, 304 responses: {client.not_modified}")       # still 1
+
+    print("\n--- Errors ---")
+    print(client.get("/api/users/9999")[:2])
+    print(client.get("/api/users?limit=1000")[:2])
+
+    print(f"\nconnections opened: {client.connections_opened}, "
+          f"server cache hits/misses: {server.cache.hits}/{server.cache.misses}")
+    print(f"all users via cursors: {sum(1 for _ in client.iter_users(limit=20))}")  # 51
+    client.close()
+    server.shutdown()
+
+"""
+USEFUL HTTP TOOLS AND EXAMPLES:
+
+Standard Library:
+- http.server.ThreadingHTTPServer: One thread per connection, fine for local tools/tests
+- BaseHTTPRequestHandler.protocol_version = "HTTP/1.1": Enables keep-alive (send Content-Length!)
+- http.client.HTTPConnection: Low-level client; reuse the object to reuse the TCP connection
+- urllib.parse.urlsplit / parse_qs: Parse paths and query strings
+- bisect.bisect_right(sorted_ids, last_id): Keyset "WHERE id > last_id" in O(log n)
+
+Notes:
+- ETag + If-None-Match saves bandwidth and serialization, not the round trip
+- Version-based ETags are cheap: no need to hash the body
+- Offset pagination is O(offset); cursors are O(log n) and stable under inserts
+- In production: a real WSGI/ASGI server, gzip, auth, rate limits, and a shared cache
+"""
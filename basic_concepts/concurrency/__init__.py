@@ -0,0 +1,6 @@
+"""Concurrency examples with threads and asyncio."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["asyncio_example", "threads_example"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
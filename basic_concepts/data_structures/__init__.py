@@ -0,0 +1,6 @@
+"""Built-in collections and zero-copy slice views."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["List_Tuple_Dictionary_Set", "slice_view_example"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
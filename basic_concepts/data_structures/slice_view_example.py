@@ -0,0 +1,175 @@
+"""
+Slice View Concept:
+Every slicing expression in List_Tuple_Dictionary_Set.py (sample[::2], sample[::-1],
+cart[:3]) builds a brand-new list and copies the element references into it. For small
+lists that is exactly what you want, but on large buffers a slice doubles the memory and
+costs O(k) time even if you only look at a couple of elements.
+
+A SliceView is a lightweight window over an existing sequence: it stores only the base
+object plus a range(start, stop, step). Slicing a view slices the range (O(1), no copy),
+so views can be nested, reversed and strided freely; data is copied only when you ask for
+it with materialize(). This is the same idea as memoryview for bytes and NumPy views for
+arrays, generalized to any list/array/bytes/memoryview.
+
+Caveat: a view reflects later changes to the base, and must not outlive structural changes
+(append/insert/pop) to a list that would shift its indices.
+"""
+
+import sys
+import time
+from array import array
+from collections.abc import Sequence
+
+
+class SliceView(Sequence):
+    """Read-only, zero-copy view of base[start:stop:step]"""
+
+    __slots__ = ("_base", "_range")
+
+    def __init__(self, base, index=slice(None)):
+        if isinstance(base, SliceView):
+            # Flatten views of views so access is always one indirection deep
+            self._base = base._base
+            self._range = base._range[index]
+        else:
+            self._base = base
+            self._range = range(len(base))[index]
+
+    @property
+    def base(self):
+        return self._base
+
+    def __len__(self):
+        return len(self._range)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SliceView(self, index)
+        return self._base[self._range[index]]
+
+    def __iter__(self):
+        r = self._range
+        base = self._base
+        if r.step == 1 and isinstance(base, (bytes, bytearray, memoryview, array)):
+            # Contiguous window over a buffer: let memoryview iterate it in C
+            yield from memoryview(base)[r.start:r.stop]
+            return
+        for i in r:
+            yield base[i]
+
+    def __reversed__(self):
+        return iter(SliceView(self, slice(None, None, -1)))
+
+    def __repr__(self):
+        r = self._range
+        stop = "" if r.stop < 0 else r.stop
+        return f"SliceView({type(self._base).__name__}[{r.start}:{stop}:{r.step}], len={len(r)})"
+
+    def reverse(self):
+        """Return a reversed view (no copy)"""
+        return self[::-1]
+
+    def stride(self, step):
+        """Return a view of every step-th element (no copy)"""
+        return self[::step]
+
+    def materialize(self, factory=None):
+        """
+        Copy the viewed elements into a new object of the base's type (or factory).
+
+        Uses the base's own slicing, which runs in C, instead of iterating in Python.
+        """
+        r = self._range
+        start, stop, step = r.start, r.stop, r.step
+        if stop < 0:
+            stop = None  # reversed view that runs to index 0
+        data = self._base[start:stop:step] if len(r) else self._base[0:0]
+        if isinstance(data, memoryview):
+            data = data.tobytes() if factory is None else data
+        return data if factory is None else factory(data)
+
+
+def view(base, start=None, stop=None, step=None):
+    """Shortcut: view(data, 2, 8, 2) is the zero-copy version of data[2:8:2]"""
+    return SliceView(base, slice(start, stop, step))
+
+
+# === BENCHMARK ===
+def _measure(label, operation):
+    import tracemalloc  # only the benchmark needs it, and it's slow to import
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = operation()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:34} {elapsed * 1e3:9.3f} ms  peak={peak / 1e6:8.2f} MB")
+    return result
+
+
+def run_benchmark(n=10_000_000):
+    """Native slicing vs SliceView on a list, an array and bytes of n elements"""
+    buffers = {
+        "list": list(range(n)),
+        "array('q')": array("q", range(n)),
+        "bytes": (bytes(range(256)) * (n // 256 + 1))[:n],
+    }
+    for name, data in buffers.items():
+        print(f"\n{name} with {n:,} elements")
+        _measure("native data[::2]", lambda: data[::2])
+        _measure("native data[::-1][::2][:1000]", lambda: data[::-1][::2][:1000])
+        _measure("SliceView [::2]", lambda: view(data)[::2])
+        nested = _measure("SliceView [::-1][::2][:1000]", lambda: view(data)[::-1][::2][:1000])
+        _measure("  ...then materialize()", nested.materialize)
+        _measure("sum(native data[::2])", lambda: sum(data[::2]))
+        _measure("sum(SliceView [::2])", lambda: sum(view(data)[::2]))
+
+
+if __name__ == "__main__":
+    sample = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    print("=== SLICE VIEWS (NO COPIES) ===")
+    print(f"view(sample)[::2]     = {list(view(sample)[::2])}")      # [0, 2, 4, 6, 8]
+    print(f"view(sample)[::-1]    = {list(view(sample)[::-1])}")     # [9, 8, ..., 0]
+    print(f"view(sample)[2:8:2]   = {list(view(sample)[2:8:2])}")    # [2, 4, 6]
+
+    nested = view(sample)[::-1][1::2]
+    print(f"nested view           = {nested}")
+    print(f"nested.materialize()  = {nested.materialize()}")         # [8, 6, 4, 2, 0]
+
+    cart = ["apple", "bread", "milk", "eggs", "butter", "cheese"]
+    first_three = view(cart)[:3]
+    cart[0] = "pear"
+    print(f"views see base changes: {list(first_three)}")           # ['pear', 'bread', 'milk']
+
+    packet = b"HEADERpayload-bytes"
+    body = view(packet)[6:]
+    print(f"bytes view materialized: {body.materialize()}")         # b'payload-bytes'
+    print(f"view object size: {sys.getsizeof(body)} bytes (independent of slice length)")
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    print("\n=== BENCHMARK ===")
+    run_benchmark(size)
+
+"""
+USEFUL SLICING/VIEW TOOLS AND EXAMPLES:
+
+Core Tools:
+- range(len(seq))[slice]: Slicing a range is O(1) and composes start/stop/step for you
+- memoryview(buf)[a:b]: Zero-copy view for bytes, bytearray and array.array
+- itertools.islice(seq, a, b, step): Lazy iteration over a slice (forward steps only)
+- collections.abc.Sequence: Implement __len__ and __getitem__ to get index/count/in/reversed for free
+
+Trade-offs:
+- Native slices: fastest to iterate afterwards, but O(k) time and memory up front
+- Views: O(1) to create, slower per-element access (one extra index translation)
+- Views keep the whole base alive; materialize() small results you want to keep
+
+Real-World Examples:
+1. Paginating a large in-memory result set:
+   page = view(rows)[offset:offset + limit]
+
+2. Parsing binary protocols without copying:
+   header, payload = view(packet)[:6], view(packet)[6:]
+"""
@@ -0,0 +1,6 @@
+"""Real interview exercises."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["technical_consultant"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
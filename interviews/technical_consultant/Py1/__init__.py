@@ -0,0 +1,6 @@
+"""Exercise 1: copying a file safely. Run with: python -m interviews.technical_consultant.Py1"""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = []  # the exercise is __main__.py, run with python -m
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,6 @@
+"""Exercise 2: the last element(s) of a sequence. Run with: python -m interviews.technical_consultant.Py2"""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["last_items"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,193 @@
+"""
+Last N Items Concept:
+Exercise 1 in __main__.py shows four ways to get the last element of a list. They all
+assume a small in-memory list: Method 2 destroys it with pop(), and Method 4 walks the
+whole list calling len() on every iteration. None of them work for a generator (no
+indexing, no len()) or for a multi-GB log file (reading it from the start is the slow part).
+
+The right strategy depends on what you have:
+- Sequence (list, tuple, str, array, bytes):  seq[-n:] -> cost depends on n, not on len(seq)
+- Iterator/generator:   deque(iterable, maxlen=n) -> one pass, O(n) memory, loop runs in C
+- File on disk:         seek to the end and read backwards in blocks until n lines are found
+- mmap / bytes buffer:  rfind(b"\\n") backwards from the end, no reading at all
+
+last() picks the strategy automatically; tail_file() takes a path.
+"""
+
+import io
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Sequence
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+def last(source, n=1):
+    """
+    Return the last n items of source as a list.
+
+    For files and mmaps the items are lines (without line endings); text files return
+    str, binary files and mmaps return bytes. Iterators are consumed.
+
+    Raises:
+        ValueError: If n is negative.
+    """
+    if n < 0:
+        raise ValueError(f"n must be >= 0, got {n}")
+    if n == 0:
+        return []
+    if isinstance(source, mmap.mmap):
+        return tail_buffer(source, n)
+    if isinstance(source, io.IOBase) and source.seekable():
+        return _tail_file_object(source, n)
+    if isinstance(source, (Sequence, memoryview)):
+        return list(source[-n:])
+    return list(deque(source, maxlen=n))
+
+
+def last_item(source, default=None):
+    """Return the last item of source, or default if it is empty (never mutates it)"""
+    items = last(source, 1)
+    return items[0] if items else default
+
+
+def tail_buffer(buffer, n=10):
+    """Last n lines of a bytes-like object or mmap, found with rfind from the end"""
+    end = len(buffer)
+    if end == 0 or n <= 0:
+        return []
+    if buffer[end - 1:end] == b"\n":
+        end -= 1  # a trailing newline doesn't start a new line
+    lines = []
+    while len(lines) < n:
+        newline = buffer.rfind(b"\n", 0, end)
+        lines.append(bytes(buffer[newline + 1:end]))
+        if newline < 0:
+            break
+        end = newline
+    lines.reverse()
+    return lines
+
+
+def tail_file(path, n=10, encoding=None, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Last n lines of the file at path, read backwards in blocks.
+
+    Args:
+        path: File path.
+        n: Number of lines to return.
+        encoding: Decode lines with this encoding; None returns bytes.
+        block_size: Bytes read per backwards step.
+    """
+    with open(path, "rb") as f:
+        lines = _tail_binary(f, n, block_size)
+    if encoding is not None:
+        lines = [line.decode(encoding) for line in lines]
+    return lines
+
+
+def _tail_file_object(f, n, block_size=DEFAULT_BLOCK_SIZE):
+    if not isinstance(f, io.TextIOBase):
+        return _tail_binary(f, n, block_size)
+    if hasattr(f, "buffer") and _newline_is_single_byte(f.encoding):
+        # Work on the underlying binary buffer, then decode with the file's encoding;
+        # CRLF files leave a "\r" that the text layer would have translated away
+        lines = _tail_binary(f.buffer, n, block_size)
+        return [line.decode(f.encoding).removesuffix("\r") for line in lines]
+    # StringIO, or an encoding such as UTF-16 where b"\n" can be half of a character:
+    # fall back to one pass from the start
+    f.seek(0)
+    return [_strip_line_ending(line) for line in deque(f, maxlen=n)]
+
+
+def _newline_is_single_byte(encoding):
+    """True if "\n" is the byte 0x0A in encoding (UTF-8, Latin-1, ASCII, cp1252, ...)"""
+    try:
+        return "\n".encode(encoding) == b"\n"
+    except (LookupError, TypeError):
+        return False
+
+
+def _strip_line_ending(line):
+    return line.removesuffix("\n").removesuffix("\r")
+
+
+def _tail_binary(f, n, block_size):
+    if n <= 0:
+        return []
+    position = f.seek(0, os.SEEK_END)
+    chunks = []
+    newlines = 0
+    # n + 1 newlines guarantee that the first of the last n lines is complete
+    while position > 0 and newlines <= n:
+        size = min(block_size, position)
+        position -= size
+        f.seek(position)
+        chunk = f.read(size)
+        chunks.append(chunk)
+        newlines += chunk.count(b"\n")
+    chunks.reverse()
+    return tail_buffer(b"".join(chunks), n)
+
+
+# === BENCHMARK ===
+def _timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:42} {(time.perf_counter() - start) * 1e3:10.3f} ms")
+    return result
+
+
+def run_benchmark(lines=2_000_000, path="last_items_benchmark.log"):
+    """Compare reading a log from the start with seeking backwards from the end"""
+    with open(path, "w") as f:
+        f.writelines(f"2026-10-19 12:00:00 INFO request {i} served in 3ms\n" for i in range(lines))
+    size_mb = os.path.getsize(path) / 1e6
+    print(f"Log file: {lines:,} lines, {size_mb:.1f} MB")
+    try:
+        with open(path) as f:
+            _timed("deque(file, maxlen=5) (reads everything)", lambda: deque(f, maxlen=5))
+        with open(path) as f:
+            _timed("f.readlines()[-5:] (loads everything)", lambda: f.readlines()[-5:])
+        _timed("tail_file(path, 5) (seeks from the end)", lambda: tail_file(path, 5))
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _timed("last(mmap, 5) (rfind from the end)", lambda: last(mm, 5))
+
+        numbers = list(range(10_000_000))
+        _timed("last(list of 10M, 5)", lambda: last(numbers, 5))
+        _timed("last(generator of 10M, 5)", lambda: last((x for x in numbers), 5))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    my_list = [10, 20, 30, 40, 50]
+    print(f"last_item(list): {last_item(my_list)}")                # 50 (list unchanged)
+    print(f"last(list, 2): {last(my_list, 2)}")                    # [40, 50]
+    print(f"last(generator, 3): {last((x * x for x in range(10)), 3)}")  # [49, 64, 81]
+    print(f"last_item(empty, 'n/a'): {last_item(iter([]), 'n/a')}")  # n/a
+    log = b"first\nsecond\nthird\n"
+    print(f"tail_buffer(log, 2): {tail_buffer(log, 2)}")            # [b'second', b'third']
+
+    print("\n--- Benchmark ---")
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
+
+"""
+USEFUL "TAIL" TOOLS AND EXAMPLES:
+
+Core Tools:
+- seq[-1] / seq[-n:]: Constant time w.r.t. the sequence length
+- collections.deque(iterable, maxlen=n): Keeps only the last n items while consuming in C
+- f.seek(0, os.SEEK_END): Jump to the end of a binary file; returns the file size
+- mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ): Map a file into memory, pages load lazily
+- bytes.rfind(b"\\n", start, end): Search backwards without splitting the whole buffer
+
+Pitfalls:
+- list.pop() returns the last item but also removes it (mutates the input)
+- len() on every loop iteration is wasted work; and iterators have no len() at all
+- Text-mode files can't seek to arbitrary byte offsets; seek on the binary buffer instead
+- Reading backwards must handle lines longer than one block (keep reading until n+1 newlines)
+"""
@@ -0,0 +1,6 @@
+"""Technical consultant interview (Python parts)."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["Py1", "Py2"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,28 @@
+"""
+Lazy Submodules (PEP 562):
+Every package in the repository lists its submodules in __all__ and ends with
+
+    __getattr__, __dir__ = lazy_submodules(__name__, __all__)
+
+so importing a package imports none of its examples; `package.module` imports the module
+on first access (after that it is a plain attribute of the package and this code no
+longer runs). Importing this helper is free too: importlib is loaded at interpreter startup.
+"""
+
+import sys
+from importlib import import_module
+
+
+def lazy_submodules(package, names):
+    """Return module-level __getattr__ and __dir__ functions for `package`"""
+    names = frozenset(names)
+
+    def __getattr__(name):
+        if name in names:
+            return import_module(f"{package}.{name}")
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | names)
+
+    return __getattr__, __dir__
@@ -15,6 +15,7 @@ class Solution:
         return ""
     
     
-solution = Solution()
-result = solution.longestCommonPrefix(["flower","flow","floght"])
-print(result)
\ No newline at end of file
+if __name__ == "__main__":
+    solution = Solution()
+    result = solution.longestCommonPrefix(["flower","flow","floght"])
+    print(result)
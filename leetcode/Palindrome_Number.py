@@ -17,6 +17,7 @@ class Solution:
         return str(x) == str(x)[::-1]
         
 
-solution = Solution()
-result = solution.isPalindrome(12321)
-print(result)
\ No newline at end of file
+if __name__ == "__main__":
+    solution = Solution()
+    result = solution.isPalindrome(12321)
+    print(result)
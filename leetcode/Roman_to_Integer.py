@@ -40,6 +40,7 @@ class Solution:
                 prev = cur
         return total
             
-solution = Solution()
-result = solution.romanToInt("MCMXCIV")
-print(result)
\ No newline at end of file
+if __name__ == "__main__":
+    solution = Solution()
+    result = solution.romanToInt("MCMXCIV")
+    print(result)
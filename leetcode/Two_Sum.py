@@ -13,6 +13,7 @@ class Solution:
             num_indices[num] = i
 
 ##Use the class
-solution = Solution()
-result = solution.twoSum([3,2,4], 6)
-print(result)  # Output: [1, 2]
+if __name__ == "__main__":
+    solution = Solution()
+    result = solution.twoSum([3,2,4], 6)
+    print(result)  # Output: [1, 2]
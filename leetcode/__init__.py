@@ -0,0 +1,6 @@
+"""LeetCode solutions; each module's Solution class can be imported without running it."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["Add_Two_Numbers", "Longest_Common_Prefix", "Palindrome_Number", "Roman_to_Integer", "Two_Sum"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,6 @@
+"""Object-oriented programming examples."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["OOP_principles_example", "polymorphic_dispatch_example", "shapes_slots_example"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,231 @@
+"""
+Polymorphic Dispatch Concept:
+animal_sound(animal) in OOP_principles_example.py relies on plain virtual dispatch: every
+call looks up "speak" on the object's type (walking the MRO through the method cache)
+and creates a bound method before calling it. Animal.speak/Dog.speak also print directly,
+so when this runs millions of times the cost is dominated by I/O, not by dispatch.
+
+This file separates the two concerns. Animals here return their sound instead of printing
+it, and every strategy writes into a buffer that is joined once at the end. Then it
+compares several ways of choosing "which function runs for this object":
+
+- virtual dispatch:     animal.speak() (the baseline)
+- functools.singledispatch: external function overloaded by type, extensible without
+                         touching the classes (open/closed principle)
+- cached registry:      dict of type -> the function behind the bound method, resolved
+                         once per type; it can import the overloads of a singledispatch
+                         function (DispatchRegistry.from_singledispatch)
+- batched:              group a heterogeneous list by type, then run one tight
+                         map() loop per type with the function resolved once
+"""
+
+import sys
+import time
+from collections import defaultdict
+from functools import singledispatch
+from types import MethodType
+
+
+# === ANIMALS THAT RETURN INSTEAD OF PRINT ===
+class Animal:
+	def speak(self):
+		return "Animal speaks"
+
+class Dog(Animal):
+	def speak(self):
+		return "Woof!"
+
+class Cat(Animal):
+	def speak(self):
+		return "Meow!"
+
+class Cow(Animal):
+	def speak(self):
+		return "Moo!"
+
+
+def animal_sound(animal, out):
+	"""Virtual dispatch, like the original animal_sound, but writing into a buffer"""
+	out.append(animal.speak())
+
+
+# === SINGLEDISPATCH ===
+@singledispatch
+def sound(animal):
+	return animal.speak()
+
+# The overloads reuse the classes' own speak functions, so they can't drift from them;
+# registering the function directly also skips the default's per-call attribute lookup
+sound.register(Dog, Dog.speak)
+sound.register(Cat, Cat.speak)
+
+
+# === REGISTRY WITH TYPE -> FUNCTION CACHE ===
+class DispatchRegistry:
+	"""
+	Maps types to handler functions.
+
+	Explicit registrations win; otherwise the handler falls back to the type's own
+	method, looked up once per type. The cache stores the function a bound method would
+	wrap (Dog.speak), and calls it as handler(obj): the same call as obj.speak(), without
+	the per-call lookup and bound-method object. bound(obj) builds the bound method
+	from the cache when a caller needs one.
+	"""
+
+	def __init__(self, method_name="speak"):
+		self.method_name = method_name
+		self._handlers = {}
+		self._cache = {}
+
+	@classmethod
+	def from_singledispatch(cls, func, method_name="speak"):
+		"""
+		Registry with the overloads of a functools.singledispatch function.
+
+		Its default implementation (registered for object) becomes the handler for types
+		without an overload, so dispatch() returns what func() would.
+		"""
+		registry = cls(method_name)
+		for registered_cls, handler in func.registry.items():
+			registry.register(registered_cls, handler)
+		return registry
+
+	def register(self, cls, handler=None):
+		"""Register handler for cls; usable as @registry.register(Dog) decorator"""
+		if handler is None:
+			return lambda func: self.register(cls, func)
+		self._handlers[cls] = handler
+		self._cache.clear()  # subclasses may now resolve differently
+		return handler
+
+	def resolve(self, cls):
+		"""Return the handler for cls, resolving along the MRO on the first miss"""
+		handler = self._cache.get(cls)
+		if handler is None:
+			for base in cls.__mro__:
+				if base in self._handlers:
+					handler = self._handlers[base]
+					break
+			else:
+				handler = getattr(cls, self.method_name)
+			self._cache[cls] = handler
+		return handler
+
+	def dispatch(self, obj):
+		return self.resolve(type(obj))(obj)
+
+	def bound(self, obj):
+		"""The cached handler bound to obj (like obj.speak, but resolved through the registry)"""
+		return MethodType(self.resolve(type(obj)), obj)
+
+	def run(self, objects, out):
+		"""Per-object dispatch through the cache; preserves input order"""
+		cache_get = self._cache.get
+		resolve = self.resolve
+		append = out.append
+		for obj in objects:
+			cls = type(obj)
+			handler = cache_get(cls) or resolve(cls)
+			append(handler(obj))
+
+	def run_batched(self, objects, out):
+		"""
+		Group objects by type and run one tight loop per type.
+
+		Output is grouped by type (first-seen order), not in input order.
+		Returns the number of distinct types.
+		"""
+		groups = defaultdict(list)
+		for obj in objects:
+			groups[type(obj)].append(obj)
+		for cls, group in groups.items():
+			out.extend(map(self.resolve(cls), group))
+		return len(groups)
+
+
+# === BENCHMARK ===
+def make_animals(n):
+	"""n mixed animals; a few shared instances keep memory flat even at 10M items"""
+	pool = [Animal(), Dog(), Cat(), Cow()]
+	return [pool[i % len(pool)] for i in range(n)]
+
+
+def run_benchmark(n=10_000_000):
+	animals = make_animals(n)
+	registry = DispatchRegistry()
+	dispatched = DispatchRegistry.from_singledispatch(sound)
+
+	def virtual(out):
+		append = out.append
+		for animal in animals:
+			append(animal.speak())
+
+	def single(out):
+		append = out.append
+		for animal in animals:
+			append(sound(animal))
+
+	strategies = [
+		("virtual dispatch", virtual),
+		("functools.singledispatch", single),
+		("cached registry", lambda out: registry.run(animals, out)),
+		("registry from singledispatch", lambda out: dispatched.run(animals, out)),
+		("batched by type", lambda out: registry.run_batched(animals, out)),
+	]
+
+	print(f"Dispatching {n:,} mixed animals (output buffered, not printed)")
+	baseline = None
+	for label, strategy in strategies:
+		out = []
+		start = time.perf_counter()
+		strategy(out)
+		text = "\n".join(out)  # one write instead of n prints
+		elapsed = time.perf_counter() - start
+		baseline = baseline or elapsed
+		print(f"{label:30} {elapsed:7.2f}s  {elapsed / n * 1e9:6.1f} ns/obj  "
+			  f"x{baseline / elapsed:4.2f}  ({len(text):,} chars)")
+
+
+if __name__ == "__main__":
+	print("--- Polymorphism, buffered ---")
+	buffer = []
+	for animal in (Animal(), Dog(), Cat()):
+		animal_sound(animal, buffer)
+	print("\n".join(buffer))  # Animal speaks / Woof! / Meow!
+
+	print("\n--- singledispatch ---")
+	print(sound(Dog()), sound(Cow()))  # Woof! Moo! (Cow falls back to speak())
+
+	print("\n--- Registry ---")
+	registry = DispatchRegistry()
+	registry.register(Cow, lambda cow: "MOOO!")
+	print(registry.dispatch(Cow()), registry.dispatch(Dog()))  # MOOO! Woof!
+	speak = registry.bound(Cat())
+	print(speak, speak())                                       # <bound method Cat.speak ...> Meow!
+
+	from_sound = DispatchRegistry.from_singledispatch(sound)
+	print([from_sound.dispatch(a) == sound(a) for a in (Animal(), Dog(), Cat(), Cow())])  # all True
+
+	print("\n--- Benchmark ---")
+	run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
+
+"""
+USEFUL DISPATCH TOOLS AND EXAMPLES:
+
+Core Tools:
+- obj.method(): Virtual dispatch; attribute lookup on type(obj) plus a bound-method object
+- functools.singledispatch: Overload a function on the type of its first argument
+- functools.singledispatchmethod: Same idea for methods
+- type(obj).__mro__: Resolution order used to find the handler for subclasses
+- map(func, items): Run one function over many items without a Python-level loop body
+
+Performance Notes:
+- Printing inside the hot loop costs far more than dispatch; buffer and write once
+- Resolve "which function" once per type, not once per object
+- Batching by type turns a polymorphic loop into several monomorphic ones
+- Batching changes output order; keep indices if order matters
+
+Usage:
+   python polymorphic_dispatch_example.py            # 10M objects
+   python polymorphic_dispatch_example.py 1000000    # smaller run
+"""
@@ -0,0 +1,331 @@
+"""
+Memory-Efficient Shapes Concept:
+The Shape/Square example in OOP_principles_example.py is fine for a handful of objects,
+but it has two costs that become visible with millions of geometric entities:
+
+1. Every instance carries its own __dict__ (a hash table), which is usually larger than
+   the data it stores. Declaring __slots__ replaces it with fixed attribute slots.
+2. area() is recomputed on every call. Caching the derived value is cheap, as long as the
+   cache is invalidated whenever a dimension changes (here: inside the property setters).
+   functools.cached_property can't be used because it stores the value in __dict__.
+
+For bulk data a better layout is not "one object per shape" at all but a struct-of-arrays:
+ShapeCollection keeps one array('d') per dimension and per shape type (8 bytes per value),
+and computes the areas of every shape of a type in one pass with map(operator.mul, ...)
+instead of one Python method call per shape, caching the result per type.
+
+Be honest about what that buys in pure CPython: the first pass is NOT faster than a loop
+over plain objects, because map(operator.mul, ...) still creates a float object per
+element and fsum reads them back one by one. The wins are memory, build time and the
+cached array that later calls return without recomputing. With NumPy the same layout
+also makes the arithmetic itself run over raw doubles.
+"""
+
+import math
+import operator
+import sys
+import time
+from abc import ABC, abstractmethod
+from array import array
+
+
+# === SLOTTED SHAPES WITH CACHED DERIVED PROPERTIES ===
+class Shape(ABC):
+	__slots__ = ("_area", "_perimeter")
+
+	def __init__(self):
+		self._invalidate()
+
+	def _invalidate(self):
+		"""Drop cached derived values; called whenever a dimension changes"""
+		self._area = None
+		self._perimeter = None
+
+	def area(self):
+		if self._area is None:
+			self._area = self._compute_area()
+		return self._area
+
+	def perimeter(self):
+		if self._perimeter is None:
+			self._perimeter = self._compute_perimeter()
+		return self._perimeter
+
+	@abstractmethod
+	def _compute_area(self):
+		pass
+
+	@abstractmethod
+	def _compute_perimeter(self):
+		pass
+
+
+class Square(Shape):
+	__slots__ = ("_side",)
+
+	def __init__(self, side):
+		self._side = side
+		super().__init__()
+
+	@property
+	def side(self):
+		return self._side
+
+	@side.setter
+	def side(self, value):
+		self._side = value
+		self._invalidate()
+
+	def _compute_area(self):
+		return self._side * self._side
+
+	def _compute_perimeter(self):
+		return 4 * self._side
+
+
+class Rectangle(Shape):
+	__slots__ = ("_width", "_height")
+
+	def __init__(self, width, height):
+		self._width = width
+		self._height = height
+		super().__init__()
+
+	@property
+	def width(self):
+		return self._width
+
+	@width.setter
+	def width(self, value):
+		self._width = value
+		self._invalidate()
+
+	@property
+	def height(self):
+		return self._height
+
+	@height.setter
+	def height(self, value):
+		self._height = value
+		self._invalidate()
+
+	def _compute_area(self):
+		return self._width * self._height
+
+	def _compute_perimeter(self):
+		return 2 * (self._width + self._height)
+
+
+class Circle(Shape):
+	__slots__ = ("_radius",)
+
+	def __init__(self, radius):
+		self._radius = radius
+		super().__init__()
+
+	@property
+	def radius(self):
+		return self._radius
+
+	@radius.setter
+	def radius(self, value):
+		self._radius = value
+		self._invalidate()
+
+	def _compute_area(self):
+		return math.pi * self._radius * self._radius
+
+	def _compute_perimeter(self):
+		return 2 * math.pi * self._radius
+
+
+# === STRUCT-OF-ARRAYS COLLECTION ===
+class ShapeCollection:
+	"""
+	Stores shapes as parallel arrays of doubles, one group per shape type.
+
+	Areas are computed for a whole type in one pass and cached until that type changes.
+	"""
+
+	# shape type -> dimension names (one array per dimension)
+	LAYOUT = {
+		"square": ("side",),
+		"rectangle": ("width", "height"),
+		"circle": ("radius",),
+	}
+
+	def __init__(self):
+		self._columns = {
+			kind: {dim: array("d") for dim in dims} for kind, dims in self.LAYOUT.items()
+		}
+		self._area_cache = {}
+
+	def __len__(self):
+		return sum(self.count(kind) for kind in self.LAYOUT)
+
+	def count(self, kind):
+		first_dim = self.LAYOUT[kind][0]
+		return len(self._columns[kind][first_dim])
+
+	def add(self, kind, *dimensions):
+		"""Append a shape and return its index within its type"""
+		dims = self.LAYOUT[kind]
+		if len(dimensions) != len(dims):
+			raise ValueError(f"{kind} expects {len(dims)} dimensions: {dims}")
+		values = array("d", dimensions)  # converts every value before any column changes
+		columns = self._columns[kind]
+		for dim, value in zip(dims, values):
+			columns[dim].append(value)
+		self._area_cache.pop(kind, None)
+		return len(columns[dims[0]]) - 1
+
+	def add_shape(self, shape):
+		"""Append an object-based shape (Square, Rectangle or Circle)"""
+		if isinstance(shape, Square):
+			return self.add("square", shape.side)
+		if isinstance(shape, Rectangle):
+			return self.add("rectangle", shape.width, shape.height)
+		if isinstance(shape, Circle):
+			return self.add("circle", shape.radius)
+		raise TypeError(f"Unsupported shape: {type(shape).__name__}")
+
+	def extend(self, kind, *columns):
+		"""Bulk-append whole columns, e.g. extend("rectangle", widths, heights)"""
+		dims = self.LAYOUT[kind]
+		if len(columns) != len(dims):
+			raise ValueError(f"{kind} expects {len(dims)} columns: {dims}")
+		# Convert every column first, so a bad value or a length mismatch changes nothing
+		converted = [array("d", values) for values in columns]
+		if len({len(values) for values in converted}) > 1:
+			raise ValueError(f"{kind} columns must have the same length, got {[len(v) for v in converted]}")
+		for dim, values in zip(dims, converted):
+			self._columns[kind][dim].extend(values)
+		self._area_cache.pop(kind, None)
+
+	def set(self, kind, index, dimension, value):
+		"""Change one dimension of one shape; invalidates the cached areas of that type"""
+		self._columns[kind][dimension][index] = value
+		self._area_cache.pop(kind, None)
+
+	def get(self, kind, index):
+		columns = self._columns[kind]
+		return tuple(columns[dim][index] for dim in self.LAYOUT[kind])
+
+	def areas(self, kind):
+		"""Areas of every shape of one type, computed in one pass and cached until it changes"""
+		cached = self._area_cache.get(kind)
+		if cached is None:
+			columns = self._columns[kind]
+			if kind == "square":
+				side = columns["side"]
+				cached = array("d", map(operator.mul, side, side))
+			elif kind == "rectangle":
+				cached = array("d", map(operator.mul, columns["width"], columns["height"]))
+			else:
+				radius = columns["radius"]
+				squared = map(operator.mul, radius, radius)
+				cached = array("d", map(math.pi.__mul__, squared))
+			self._area_cache[kind] = cached
+		return cached
+
+	def total_area(self):
+		return math.fsum(math.fsum(self.areas(kind)) for kind in self.LAYOUT)
+
+
+# === BENCHMARK ===
+def _measure(label, build, compute):
+	import tracemalloc  # only the benchmark needs it, and it's slow to import
+
+	tracemalloc.start()
+	start = time.perf_counter()
+	container = build()
+	build_time = time.perf_counter() - start
+	memory = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+
+	times = []
+	for _ in range(2):  # first pass, then again (cached where the design caches)
+		start = time.perf_counter()
+		total = compute(container)
+		times.append(time.perf_counter() - start)
+	print(f"{label:28} memory={memory / 1e6:8.1f} MB  build={build_time:6.2f}s  "
+		  f"areas={times[0]:6.3f}s  again={times[1]:6.3f}s  total={total:.1f}")
+
+
+def run_benchmark(n=1_000_000):
+	"""Compare dict-based objects, slotted objects and the struct-of-arrays collection"""
+
+	class DictSquare:
+		def __init__(self, side):
+			self.side = side
+
+		def area(self):
+			return self.side * self.side
+
+	sides = [float(i % 100 + 1) for i in range(n)]
+	print(f"Computing the area of {n:,} squares")
+	_measure("plain objects (__dict__)",
+			 lambda: [DictSquare(s) for s in sides],
+			 lambda shapes: math.fsum(s.area() for s in shapes))
+	_measure("slotted Square objects",
+			 lambda: [Square(s) for s in sides],
+			 lambda shapes: math.fsum(s.area() for s in shapes))
+
+	def build_collection():
+		collection = ShapeCollection()
+		collection.extend("square", sides)
+		return collection
+	_measure("ShapeCollection (SoA)",
+			 build_collection,
+			 lambda collection: math.fsum(collection.areas("square")))
+
+	plain = DictSquare(1)
+	dict_size = sys.getsizeof(plain) + sys.getsizeof(plain.__dict__)
+	print(f"\nPer-instance size: __dict__ object={dict_size} B, "
+		  f"slotted Square={sys.getsizeof(Square(1))} B, array slot=8 B")
+
+
+if __name__ == "__main__":
+	print("--- Cached derived properties ---")
+	rect = Rectangle(3, 4)
+	print(f"Area: {rect.area()}")  # 12 (computed)
+	print(f"Area: {rect.area()}")  # 12 (cached)
+	rect.width = 5
+	print(f"Area after resize: {rect.area()}")  # 20 (cache invalidated)
+
+	print("\n--- __slots__ means no per-instance __dict__ ---")
+	try:
+		Square(2).color = "red"
+	except AttributeError as e:
+		print(f"AttributeError: {e}")
+
+	print("\n--- Struct-of-arrays collection ---")
+	shapes = ShapeCollection()
+	for shape in (Square(2), Rectangle(2, 3), Circle(1), Square(3)):
+		shapes.add_shape(shape)
+	print(f"Square areas: {list(shapes.areas('square'))}")  # [4.0, 9.0]
+	shapes.set("square", 0, "side", 10)
+	print(f"After update: {list(shapes.areas('square'))}")  # [100.0, 9.0]
+	print(f"Total area: {shapes.total_area():.2f}")
+
+	print("\n--- Benchmark ---")
+	run_benchmark()
+
+"""
+USEFUL MEMORY/CACHING TOOLS AND EXAMPLES:
+
+Core Tools:
+- __slots__ = ("a", "b"): Fixed attributes, no per-instance __dict__ (each subclass must declare its own)
+- @property + setter: Hook attribute writes to invalidate cached values
+- functools.cached_property: Simple lazy caching, but requires __dict__ (incompatible with __slots__)
+- array.array("d"): Compact, contiguous storage of C doubles (8 bytes each vs ~24+ for a float object)
+- map(operator.mul, a, b): Element-wise product with no Python-level loop body (but still
+  one float object per element, so not faster than a plain loop by itself)
+- tracemalloc / sys.getsizeof: Measure allocations and object sizes
+
+Common Patterns:
+- Array-of-structs (one object per entity) is easy to use; struct-of-arrays is compact for
+  bulk data, and fast for bulk math once the math runs over raw doubles (NumPy)
+- Invalidate caches where the state changes, not where the value is read
+- With NumPy available, the same layout becomes np.pi * radius ** 2 over an ndarray
+"""
@@ -0,0 +1,6 @@
+"""OOP, design patterns, architecture styles and design principles."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["OOP", "design_patterns", "microservices_monoliths", "principles"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,6 @@
+"""Creational, structural and behavioral patterns."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["coffee_decorator_compile_example", "command_history_example", "config_registry_example", "facade_pipeline_example", "object_pool_example", "observer_event_bus_example", "test_object_pool_example"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
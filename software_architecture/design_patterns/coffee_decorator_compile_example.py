@@ -0,0 +1,276 @@
+"""
+Compiled Decorator Chain Concept (Decorator pattern, flattened):
+In _structural_patterns.txt, MilkDecorator(SugarDecorator(SimpleCoffee())) answers cost()
+and description() recursively: each layer calls the layer below it, so a stack of N
+decorators costs N Python calls per question, and description() rebuilds a longer string
+at every layer (O(N^2) characters copied). At around 1000 layers the recursion also runs
+into Python's default recursion limit.
+
+The decorator stack only changes when someone adds or removes a topping, while cost()
+and description() are read far more often. So we "compile" the stack once:
+
+- compile_coffee(coffee) walks the layers iteratively and produces a CompiledCoffee with a
+  precomputed cost and description (the same float additions in the same order, so the
+  result is identical to the recursive one).
+- Each decorator class declares its contribution (extra_cost / extra_description), which
+  is what makes flattening possible without calling every layer.
+- CoffeeOrder keeps the stack as a tuple of decorator classes (replaced, never mutated, so
+  orders with the same recipe share it), caches its compiled form and invalidates it on
+  add()/remove(). Compiled stacks are also shared between orders with the same recipe
+  through an LRU cache keyed by that tuple, so a million orders of "coffee with milk"
+  compile once.
+"""
+
+import sys
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+
+# === ORIGINAL COMPONENTS (recursive evaluation) ===
+class Coffee(ABC):
+    @abstractmethod
+    def cost(self):
+        pass
+
+    @abstractmethod
+    def description(self):
+        pass
+
+
+class SimpleCoffee(Coffee):
+    def cost(self):
+        return 2.0
+
+    def description(self):
+        return "Simple coffee"
+
+
+class CoffeeDecorator(Coffee):
+    extra_cost = 0.0
+    extra_description = None
+
+    def __init__(self, coffee):
+        self._coffee = coffee
+
+    def cost(self):
+        return self._coffee.cost() + self.extra_cost
+
+    def description(self):
+        if self.extra_description is None:
+            return self._coffee.description()
+        return self._coffee.description() + ", " + self.extra_description
+
+
+class MilkDecorator(CoffeeDecorator):
+    extra_cost = 0.5
+    extra_description = "milk"
+
+
+class SugarDecorator(CoffeeDecorator):
+    extra_cost = 0.2
+    extra_description = "sugar"
+
+
+class CaramelDecorator(CoffeeDecorator):
+    extra_cost = 0.7
+    extra_description = "caramel"
+
+
+# === COMPILED FORM ===
+class CompiledCoffee(Coffee):
+    """A whole decorator stack reduced to two precomputed values"""
+
+    __slots__ = ("_cost", "_description", "layers")
+
+    def __init__(self, cost, description, layers):
+        self._cost = cost
+        self._description = description
+        self.layers = layers
+
+    def cost(self):
+        return self._cost
+
+    def description(self):
+        return self._description
+
+
+def _flattenable(layer):
+    """True if the layer's effect is fully described by extra_cost/extra_description"""
+    return layer.cost is CoffeeDecorator.cost and layer.description is CoffeeDecorator.description
+
+
+def _evaluate(coffee, layers):
+    """Compile by evaluating recursively once (a layer overrides cost() or description())"""
+    return CompiledCoffee(coffee.cost(), coffee.description(), layers)
+
+
+def _compile(base, layers):
+    """base: the undecorated coffee; layers: decorator classes from innermost to outermost"""
+    cost = base.cost()
+    parts = [base.description()]
+    for layer in layers:
+        cost += layer.extra_cost
+        if layer.extra_description is not None:
+            parts.append(layer.extra_description)
+    return CompiledCoffee(cost, ", ".join(parts), len(layers))
+
+
+def compile_coffee(coffee):
+    """Flatten an existing MilkDecorator(SugarDecorator(...)) stack without recursion"""
+    outermost = coffee
+    layers = []
+    while isinstance(coffee, CoffeeDecorator):
+        layers.append(type(coffee))
+        coffee = coffee._coffee
+    if not all(map(_flattenable, layers)):
+        return _evaluate(outermost, len(layers))
+    layers.reverse()
+    return _compile(coffee, layers)
+
+
+@lru_cache(maxsize=4096)
+def compile_recipe(base_cls, layers):
+    """Shared compiled stack per (base class, tuple of decorator classes)"""
+    if not all(map(_flattenable, layers)):
+        coffee = base_cls()
+        for layer in layers:
+            coffee = layer(coffee)
+        return _evaluate(coffee, len(layers))
+    return _compile(base_cls(), layers)
+
+
+class CoffeeOrder(Coffee):
+    """
+    A mutable decorator stack that answers cost()/description() from its compiled form.
+
+    The layers are kept in a tuple replaced on add()/remove(), so orders built from the
+    same recipe share it; the compiled form is recomputed lazily after a change.
+    """
+
+    __slots__ = ("base", "_layers", "_compiled")
+
+    def __init__(self, base=SimpleCoffee, layers=()):
+        self.base = base
+        self._layers = tuple(layers)
+        self._compiled = None
+
+    def add(self, decorator):
+        self._layers += (decorator,)
+        self._compiled = None
+        return self
+
+    def remove(self, decorator):
+        """Remove the outermost layer of this decorator type"""
+        for index in range(len(self._layers) - 1, -1, -1):
+            if self._layers[index] is decorator:
+                self._layers = self._layers[:index] + self._layers[index + 1:]
+                self._compiled = None
+                return self
+        raise ValueError(f"{decorator.__name__} is not in this order")
+
+    def compiled(self):
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = compile_recipe(self.base, self._layers)
+        return compiled
+
+    def cost(self):
+        return self.compiled().cost()
+
+    def description(self):
+        return self.compiled().description()
+
+    def to_decorators(self):
+        """Build the equivalent recursive object, e.g. for comparison"""
+        coffee = self.base()
+        for layer in self._layers:
+            coffee = layer(coffee)
+        return coffee
+
+
+# === BENCHMARK ===
+def _recipe(depth):
+    toppings = (MilkDecorator, SugarDecorator, CaramelDecorator)
+    return [toppings[i % len(toppings)] for i in range(depth)]
+
+
+def run_benchmark(orders=1_000_000, depths=(10, 100, 1000), recursive_budget=5_000_000):
+    """
+    Evaluate cost() and description() for every order, compiled vs recursive.
+
+    Recursive evaluation does O(depth) work per order, so it runs on a sample of
+    recursive_budget // depth orders and is reported per order.
+    """
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 3 * max(depths) + 100))
+    print(f"{orders:,} orders per depth, ns per order "
+          f"(recursive: sampled; compiled 1st: includes the recipe cache lookup)")
+    print(f"{'depth':>6} {'recursive':>12} {'compiled (1st)':>15} {'compiled (cached)':>18} {'speedup':>9}")
+    for depth in depths:
+        layers = tuple(_recipe(depth))
+        recursive = CoffeeOrder(layers=layers).to_decorators()
+        sample = max(1, min(orders, recursive_budget // depth))
+        start = time.perf_counter()
+        for _ in range(sample):
+            recursive.cost()
+            recursive.description()
+        recursive_ns = (time.perf_counter() - start) / sample * 1e9
+
+        # Millions of independent order objects sharing a handful of recipes
+        order_list = [CoffeeOrder(layers=layers) for _ in range(orders)]
+        start = time.perf_counter()
+        for order in order_list:
+            order.cost()
+            order.description()
+        compiled_ns = (time.perf_counter() - start) / orders * 1e9
+        start = time.perf_counter()
+        for order in order_list:
+            order.cost()
+            order.description()
+        cached_ns = (time.perf_counter() - start) / orders * 1e9
+
+        compiled = order_list[0].compiled()
+        assert compiled.cost() == recursive.cost()
+        assert compiled.description() == recursive.description()
+        print(f"{depth:>6} {recursive_ns:>12,.0f} {compiled_ns:>15,.0f} {cached_ns:>18,.0f} "
+              f"{recursive_ns / cached_ns:>8,.0f}x")
+    print(f"compile cache: {compile_recipe.cache_info()}")
+
+
+if __name__ == "__main__":
+    print("--- Recursive vs compiled ---")
+    coffee = SugarDecorator(MilkDecorator(SimpleCoffee()))
+    print(f"{coffee.description()}: ${coffee.cost()}")        # Simple coffee, milk, sugar: $2.7
+    flat = compile_coffee(coffee)
+    print(f"{flat.description()}: ${flat.cost()} ({flat.layers} layers flattened)")
+
+    print("\n--- Invalidation when the stack changes ---")
+    order = CoffeeOrder().add(MilkDecorator).add(SugarDecorator)
+    print(f"{order.description()}: ${order.cost()}")
+    order.add(CaramelDecorator).remove(SugarDecorator)
+    print(f"{order.description()}: ${order.cost():.1f}")      # Simple coffee, milk, caramel: $3.2
+
+    print("\n--- Benchmark ---")
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
+
+"""
+USEFUL CACHING/FLATTENING TOOLS AND EXAMPLES:
+
+Core Tools:
+- functools.lru_cache: Memoize a pure function (arguments must be hashable, e.g. tuples)
+- ", ".join(parts): Build a string once instead of concatenating at every layer
+- sys.setrecursionlimit(n): Raise the limit for deep recursion (or avoid recursion entirely)
+
+Design Notes:
+- Compile when the structure changes, evaluate many times: the same idea as compiled
+  regexes (re.compile), query plans and template engines
+- Flattening needs each layer to describe its effect as data (extra_cost), not only as code;
+  a layer that overrides cost()/description() is evaluated recursively once instead
+- Invalidate on every mutation path; immutable stacks (tuples) make cache keys trivial
+- Keep the float additions in the original order so compiled results match exactly
+
+Real-World Examples:
+1. Middleware stacks (WSGI/ASGI) composed once at startup instead of per request
+2. Pricing engines: base price + ordered list of adjustments compiled per product
+3. Logging handlers/filters resolved once per logger, not per record
+"""
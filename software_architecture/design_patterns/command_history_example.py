@@ -0,0 +1,424 @@
+"""
+Command Processing Concept (Command pattern, scaled up):
+RemoteControl in _behavioral_patterns.txt remembers only last_command, so it can undo one
+step and never redo. Keeping every command in a plain list fixes that but grows without
+bound, and a user flicking the same light on/off a thousand times fills the history with
+a thousand entries that undo one at a time.
+
+CommandProcessor keeps the Command/Light/LightOnCommand/LightOffCommand vocabulary and adds:
+
+- Bounded undo/redo history: a ring buffer (deque with maxlen) plus an optional memory
+  cap; the oldest entries are evicted first.
+- Coalescing: a command may merge() with the previous one. Consecutive switch commands on
+  the same Light collapse into one entry that remembers the state before the first and
+  the state after the last; if they cancel out (on then off) the entry disappears.
+- Transactional batches: execute_batch() compacts the batch (merging commands with the
+  same merge_key), runs it, and on failure undoes the commands already run in reverse
+  order. A successful batch is a single undo step (MacroCommand).
+"""
+
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+
+
+# === COMMAND INTERFACE ===
+class Command(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def execute(self):
+        pass
+
+    @abstractmethod
+    def undo(self):
+        pass
+
+    def redo(self):
+        """Execute again after undo(), restoring the state execute() produced"""
+        self.execute()
+
+    def snapshot(self):
+        """
+        The object to keep in the history for the execution that just happened.
+
+        Commands that remember per-execution state (e.g. the previous value for undo) return
+        a copy, so pressing the same instance again doesn't rewrite an older history entry.
+        """
+        return self
+
+    def merge_key(self):
+        """Commands with equal, non-None keys may be merged; None means "never merge" """
+        return None
+
+    def merge(self, other):
+        """Return one command equivalent to running self then other, or None"""
+        return None
+
+    def is_noop(self):
+        """True if executing this command would change nothing (safe to drop)"""
+        return False
+
+    def memory_size(self):
+        """Approximate bytes held by this command in the history"""
+        return sys.getsizeof(self)
+
+
+# === RECEIVER ===
+class Light:
+    __slots__ = ("location", "is_on", "switches")
+
+    def __init__(self, location):
+        self.location = location
+        self.is_on = False
+        self.switches = 0  # how many times the hardware was actually switched
+
+    def turn_on(self):
+        self.is_on = True
+        self.switches += 1
+
+    def turn_off(self):
+        self.is_on = False
+        self.switches += 1
+
+    def set(self, on):
+        if on:
+            self.turn_on()
+        else:
+            self.turn_off()
+
+    def __repr__(self):
+        return f"{self.location} light is {'ON' if self.is_on else 'OFF'}"
+
+
+# === CONCRETE COMMANDS ===
+class LightSwitchCommand(Command):
+    """Sets a light to a target state and remembers the previous one for undo"""
+
+    __slots__ = ("light", "target", "previous")
+
+    def __init__(self, light, target, previous=None):
+        self.light = light
+        self.target = target
+        self.previous = previous  # captured on every execute, None until then
+
+    def execute(self):
+        self.previous = self.light.is_on
+        if self.light.is_on != self.target:
+            self.light.set(self.target)
+
+    def undo(self):
+        if self.previous is not None and self.light.is_on != self.previous:
+            self.light.set(self.previous)
+
+    def redo(self):
+        # Keep the captured previous state: it is what the next undo() must restore
+        if self.light.is_on != self.target:
+            self.light.set(self.target)
+
+    def snapshot(self):
+        return LightSwitchCommand(self.light, self.target, self.previous)
+
+    def merge_key(self):
+        return id(self.light)
+
+    def merge(self, other):
+        if isinstance(other, LightSwitchCommand) and other.light is self.light:
+            return LightSwitchCommand(self.light, other.target, self.previous)
+        return None
+
+    def is_noop(self):
+        return self.previous is not None and self.previous == self.target
+
+
+class LightOnCommand(LightSwitchCommand):
+    __slots__ = ()
+
+    def __init__(self, light):
+        super().__init__(light, True)
+
+
+class LightOffCommand(LightSwitchCommand):
+    __slots__ = ()
+
+    def __init__(self, light):
+        super().__init__(light, False)
+
+
+class MacroCommand(Command):
+    """Several commands executed and undone as one unit"""
+
+    __slots__ = ("commands",)
+
+    def __init__(self, commands):
+        self.commands = tuple(commands)
+
+    def execute(self):
+        for command in self.commands:
+            command.execute()
+
+    def undo(self):
+        for command in reversed(self.commands):
+            command.undo()
+
+    def redo(self):
+        for command in self.commands:
+            command.redo()
+
+    def snapshot(self):
+        return MacroCommand(command.snapshot() for command in self.commands)
+
+    def memory_size(self):
+        return sys.getsizeof(self) + sum(c.memory_size() for c in self.commands)
+
+
+def compact(commands):
+    """
+    Merge commands that share a merge_key into the position of the first one.
+
+    Commands with different keys are assumed to be independent (e.g. different lights);
+    a command without a key acts as a barrier that nothing is merged across.
+    """
+    result = []
+    position = {}  # merge_key -> index in result
+    for command in commands:
+        key = command.merge_key()
+        if key is None:
+            result.append(command)
+            position.clear()
+            continue
+        index = position.get(key)
+        merged = result[index].merge(command) if index is not None else None
+        if merged is None:
+            position[key] = len(result)
+            result.append(command)
+        else:
+            result[index] = merged
+    return result
+
+
+# === BOUNDED UNDO/REDO HISTORY ===
+class CommandHistory:
+    """
+    Ring-buffer undo history with coalescing and an optional memory cap.
+
+    Args:
+        max_commands: Maximum number of undo steps kept.
+        max_bytes: Evict the oldest steps once their estimated size exceeds this.
+        coalesce: Merge a new command into the previous entry when possible.
+    """
+
+    def __init__(self, max_commands=1000, max_bytes=None, coalesce=True):
+        self.max_bytes = max_bytes
+        self.coalesce = coalesce
+        self._undo = deque(maxlen=max_commands)
+        self._redo = []
+        self._bytes = 0
+        self.evicted = 0
+        self.merged = 0
+
+    def __len__(self):
+        return len(self._undo)
+
+    @property
+    def memory_bytes(self):
+        return self._bytes
+
+    def push(self, command):
+        """Record an executed command; clears the redo stack"""
+        self._redo.clear()
+        undo = self._undo
+        if self.coalesce and undo:
+            previous = undo[-1]
+            merged = previous.merge(command)
+            if merged is not None:
+                self.merged += 1
+                undo.pop()
+                self._bytes -= previous.memory_size()
+                if merged.is_noop():
+                    return
+                command = merged
+        if len(undo) == undo.maxlen:
+            self._bytes -= undo[0].memory_size()  # deque is about to drop it
+            self.evicted += 1
+        undo.append(command)
+        self._bytes += command.memory_size()
+        if self.max_bytes is not None:
+            while self._bytes > self.max_bytes and len(undo) > 1:
+                self._bytes -= undo.popleft().memory_size()
+                self.evicted += 1
+
+    def undo(self):
+        """Undo the most recent step; returns it, or None if there is nothing to undo"""
+        if not self._undo:
+            return None
+        command = self._undo.pop()
+        self._bytes -= command.memory_size()
+        command.undo()
+        self._redo.append(command)
+        return command
+
+    def redo(self):
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        command.redo()
+        self._undo.append(command)
+        self._bytes += command.memory_size()
+        return command
+
+
+# === INVOKER ===
+class CommandProcessor:
+    """RemoteControl with bounded undo/redo history and transactional batches"""
+
+    def __init__(self, history=None):
+        self.history = history if history is not None else CommandHistory()
+        self.executed = 0
+
+    def press_button(self, command):
+        command.execute()
+        self.executed += 1
+        self.history.push(command.snapshot())
+
+    def press_undo(self):
+        return self.history.undo()
+
+    def press_redo(self):
+        return self.history.redo()
+
+    def execute_batch(self, commands):
+        """
+        Run commands as one transaction and one undo step.
+
+        Raises:
+            Exception: Whatever a command raised, after undoing the ones already run.
+        """
+        batch = compact(commands)
+        done = []
+        try:
+            for command in batch:
+                command.execute()
+                done.append(command.snapshot())
+        except Exception:
+            for command in reversed(done):
+                command.undo()
+            raise
+        self.executed += len(done)
+        batch = [command for command in done if not command.is_noop()]
+        if batch:
+            self.history.push(batch[0] if len(batch) == 1 else MacroCommand(batch))
+        return len(batch)
+
+
+# === BENCHMARK ===
+class _NaiveRemote:
+    """RemoteControl that keeps every command forever, for comparison"""
+
+    def __init__(self):
+        self.history = []
+
+    def press_button(self, command):
+        command.execute()
+        self.history.append(command)
+
+
+def run_benchmark(n=2_000_000, lights=100, batch_size=1000):
+    rooms = [Light(f"Room {i}") for i in range(lights)]
+    # Bursts of 10 switches on the same light, like a user flicking a switch
+    commands = [(LightOnCommand if i % 3 else LightOffCommand)(rooms[i // 10 % lights])
+                for i in range(n)]
+    print(f"{n:,} switch commands over {lights} lights, in bursts of 10")
+
+    def report(label, start, history_len, switches):
+        elapsed = time.perf_counter() - start
+        print(f"{label:34} {elapsed:6.2f}s {n / elapsed:12,.0f} cmd/s  "
+              f"history={history_len:>9,}  hardware switches={switches:,}")
+
+    def fresh():
+        for light in rooms:
+            light.is_on, light.switches = False, 0
+
+    fresh()
+    remote = _NaiveRemote()
+    start = time.perf_counter()
+    for command in commands:
+        remote.press_button(command)
+    report("naive list history", start, len(remote.history), sum(l.switches for l in rooms))
+
+    fresh()
+    processor = CommandProcessor(CommandHistory(max_commands=10_000, max_bytes=1_000_000))
+    start = time.perf_counter()
+    for command in commands:
+        processor.press_button(command)
+    report("ring buffer + coalescing", start, len(processor.history), sum(l.switches for l in rooms))
+
+    fresh()
+    processor = CommandProcessor(CommandHistory(max_commands=10_000))
+    start = time.perf_counter()
+    for i in range(0, n, batch_size):
+        processor.execute_batch(commands[i:i + batch_size])
+    report(f"compacted batches of {batch_size}", start, len(processor.history),
+           sum(l.switches for l in rooms))
+
+
+if __name__ == "__main__":
+    print("--- Coalescing repeated switches ---")
+    light = Light("Living Room")
+    remote = CommandProcessor()
+    for _ in range(3):
+        remote.press_button(LightOnCommand(light))
+        remote.press_button(LightOffCommand(light))
+    remote.press_button(LightOnCommand(light))
+    print(light, f"| history entries: {len(remote.history)}")  # ON | 1 entry
+    remote.press_undo()
+    print(light)                                                # OFF
+    remote.press_redo()
+    print(light)                                                # ON
+
+    print("\n--- Transactional batch ---")
+    kitchen = Light("Kitchen")
+
+    class FailingCommand(Command):
+        def execute(self):
+            raise RuntimeError("breaker tripped")
+
+        def undo(self):
+            pass
+
+    try:
+        remote.execute_batch([LightOnCommand(kitchen), LightOffCommand(light), FailingCommand()])
+    except RuntimeError as e:
+        print(f"Batch failed ({e}), rolled back: {kitchen}, {light}")  # OFF, ON
+
+    remote.execute_batch([LightOnCommand(kitchen), LightOffCommand(light)])
+    print(f"After batch: {kitchen}, {light}")        # ON, OFF
+    remote.press_undo()
+    print(f"Undo whole batch: {kitchen}, {light}")   # OFF, ON
+
+    print("\n--- Benchmark ---")
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
+
+"""
+USEFUL COMMAND/HISTORY TOOLS AND EXAMPLES:
+
+Core Tools:
+- collections.deque(maxlen=n): Ring buffer; appending to a full deque drops the oldest item
+- __slots__ on commands: Millions of small command objects without a __dict__ each
+- sys.getsizeof(obj): Shallow size estimate, good enough for a history memory cap
+
+Design Notes:
+- Undo must restore the state from BEFORE the first merged command, so merge() keeps
+  the first command's "previous" and the last command's "target"
+- Merged commands that cancel out are dropped instead of stored
+- Command objects are reusable: execute() captures the previous state every time, the
+  history stores a snapshot() of each execution, and redo() replays without recapturing
+- Merging only within a key is safe when commands on different keys are independent
+- A new command after undo() clears the redo stack (standard editor behavior)
+
+Real-World Examples:
+1. Text editors: consecutive keystrokes coalesce into one "typing" undo step
+2. Drawing apps: dragging a shape emits hundreds of moves that merge into one
+3. Database migrations: run a batch in a transaction, roll back on the first failure
+"""
@@ -0,0 +1,290 @@
+"""
+Thread-Safe Config Registry Concept (Singleton pattern, made safe):
+The Singleton.__new__ and ConfigManager examples in _creational_patterns.txt work in a
+single thread, but two threads calling ConfigManager() at the same time can both see
+_instance is None and each create (and initialize) their own instance. Every get() also
+reads a shared mutable dict that set() modifies in place.
+
+This file fixes both with two classic techniques:
+
+- Double-checked locking: the instance is created under a lock, but the lock is only taken
+  while the instance doesn't exist yet. After that, ConfigRegistry() is a plain attribute
+  read with no locking at all.
+- Copy-on-write snapshots: the configuration is an immutable mapping (MappingProxyType over
+  a private dict). Writers take a lock, copy the current dict, apply their change and swap
+  the reference in one assignment. Readers never lock: they just read self._snapshot,
+  which is always a complete, consistent version. Rebinding an attribute is atomic in
+  CPython, so a reader sees either the old snapshot or the new one, never a half-update.
+
+Writes are O(size of config), which is the right trade-off for configuration: it's read
+millions of times and written rarely. A ConfigWatcher polls a JSON file's mtime and
+applies only the keys that actually changed.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from types import MappingProxyType
+
+_MISSING = object()
+
+
+# === SINGLETON WITH DOUBLE-CHECKED LOCKING ===
+class ThreadSafeSingleton:
+    """Base class: one instance per subclass, created exactly once even under races"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        instance = cls.__dict__.get("_instance")  # fast path: no lock once created
+        if instance is None:
+            with cls._instance_lock:
+                instance = cls.__dict__.get("_instance")  # re-check under the lock
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialize(*args, **kwargs)
+                    cls._instance = instance
+        return instance
+
+    def _initialize(self, *args, **kwargs):
+        """Runs once, under the lock (use instead of __init__, which runs on every call)"""
+
+
+# === CONFIG REGISTRY WITH SNAPSHOT READS ===
+class ConfigRegistry(ThreadSafeSingleton):
+    """Configuration with lock-free reads from immutable, atomically swapped snapshots"""
+
+    def _initialize(self, initial=None):
+        self._write_lock = threading.Lock()
+        self._snapshot = MappingProxyType(dict(initial or {}))
+        self.version = 0
+
+    def get(self, key, default=None):
+        return self._snapshot.get(key, default)
+
+    def __getitem__(self, key):
+        return self._snapshot[key]
+
+    def snapshot(self):
+        """Immutable view of the whole config; stays consistent even if writers run"""
+        return self._snapshot
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def update(self, changes=(), removed=()):
+        """Apply several changes (and removals) as one atomic new version"""
+        with self._write_lock:
+            data = dict(self._snapshot)
+            data.update(changes)
+            for key in removed:
+                data.pop(key, None)
+            self._snapshot = MappingProxyType(data)
+            self.version += 1
+            return self.version
+
+    def replace(self, data):
+        """Swap in a completely new configuration; returns (changed, removed) keys"""
+        with self._write_lock:
+            old = self._snapshot
+            changed = {k for k, v in data.items() if old.get(k, _MISSING) != v}
+            removed = set(old) - set(data)
+            if changed or removed:
+                self._snapshot = MappingProxyType(dict(data))
+                self.version += 1
+            return changed, removed
+
+
+# === FILE WATCHER WITH INCREMENTAL RELOAD ===
+class ConfigWatcher:
+    """
+    Polls a JSON config file and applies only the keys that changed.
+
+    Args:
+        registry: ConfigRegistry to update.
+        path: JSON file with a top-level object.
+        interval: Seconds between mtime checks in the background thread.
+        on_change: Optional callback(changed_keys, removed_keys) after each reload.
+    """
+
+    def __init__(self, registry, path, interval=1.0, on_change=None):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.on_change = on_change
+        self._mtime = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self):
+        """Reload if the file changed since the last check; returns changed keys"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return set()
+        if mtime == self._mtime:
+            return set()
+        with open(self.path) as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{self.path}: expected a JSON object, got {type(data).__name__}")
+        self._mtime = mtime
+        # The diff is computed under the registry's write lock, against the live snapshot
+        changed, removed = self.registry.replace(data)
+        if (changed or removed) and self.on_change:
+            self.on_change(changed, removed)
+        return changed | removed
+
+    def start(self):
+        self.check()
+        self._thread = threading.Thread(target=self._run, name="ConfigWatcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except (OSError, ValueError) as e:
+                # A half-written or invalid file keeps the previous good config
+                print(f"[ConfigWatcher] reload skipped: {e}", file=sys.stderr)
+
+
+# === BENCHMARK ===
+class _LockedConfig:
+    """Mutable dict guarded by one lock for reads and writes, for comparison"""
+
+    def __init__(self, initial):
+        self._lock = threading.Lock()
+        self._config = dict(initial)
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._config.get(key, default)
+
+    def set(self, key, value):
+        with self._lock:
+            self._config[key] = value
+
+
+def run_benchmark(threads=32, writers=4, reads_per_thread=100_000):
+    initial = {f"key{i}": i for i in range(100)}
+    readers = threads - writers
+    print(f"{readers} reader threads x {reads_per_thread:,} reads, {writers} writer threads")
+
+    def run(config):
+        stop = threading.Event()
+        barrier = threading.Barrier(threads + 1)
+        writes = [0] * writers
+
+        def reader():
+            get = config.get
+            barrier.wait()
+            for i in range(reads_per_thread):
+                get("key42")
+
+        def writer(index):
+            barrier.wait()
+            while not stop.is_set():
+                config.set(f"key{index}", writes[index])
+                writes[index] += 1
+                time.sleep(0.0005)
+
+        pool = [threading.Thread(target=reader) for _ in range(readers)]
+        pool += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        for thread in pool:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in pool[:readers]:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        stop.set()
+        for thread in pool[readers:]:
+            thread.join()
+        return elapsed, sum(writes)
+
+    ConfigRegistry._instance = None  # fresh singleton for the benchmark
+    for label, config in [("single lock around dict", _LockedConfig(initial)),
+                          ("copy-on-write snapshots", ConfigRegistry(initial))]:
+        elapsed, writes = run(config)
+        total = readers * reads_per_thread
+        print(f"{label:26} {elapsed:6.2f}s  {total / elapsed:12,.0f} reads/s  ({writes:,} writes)")
+
+
+if __name__ == "__main__":
+    print("--- Singleton created once under a thread race ---")
+    created = []
+
+    class Probe(ThreadSafeSingleton):
+        def _initialize(self):
+            created.append(threading.current_thread().name)
+            time.sleep(0.01)  # widen the race window
+
+    racers = [threading.Thread(target=Probe) for _ in range(16)]
+    for racer in racers:
+        racer.start()
+    for racer in racers:
+        racer.join()
+    print(f"Initialized {len(created)} time(s)")  # 1
+
+    print("\n--- Snapshot reads ---")
+    config1 = ConfigRegistry({"db_url": "postgresql://localhost"})
+    config2 = ConfigRegistry()
+    print(config1 is config2, config2.get("db_url"))  # True postgresql://localhost
+    before = config1.snapshot()
+    config1.set("db_url", "postgresql://replica")
+    print(f"old snapshot: {before['db_url']}, new: {config2.get('db_url')}")
+
+    print("\n--- Watching a config file ---")
+    path = "config_registry_example.json"
+    with open(path, "w") as f:
+        json.dump({"db_url": "postgresql://localhost", "pool_size": 5}, f)
+
+    def report(changed, removed):
+        print(f"reloaded: {sorted(changed)} removed: {sorted(removed)}")
+
+    watcher = ConfigWatcher(config1, path, interval=0.05, on_change=report)
+    watcher.start()
+    time.sleep(0.1)
+    with open(path, "w") as f:
+        json.dump({"db_url": "postgresql://localhost", "pool_size": 20}, f)
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))  # make sure mtime changes
+    time.sleep(0.2)
+    watcher.stop()
+    os.remove(path)
+    print(f"pool_size = {config1.get('pool_size')} (version {config1.version})")
+
+    print("\n--- Benchmark ---")
+    run_benchmark()
+
+"""
+USEFUL THREAD-SAFETY TOOLS AND EXAMPLES:
+
+Core Tools:
+- threading.Lock(): Mutual exclusion for writers / one-time initialization
+- types.MappingProxyType(d): Read-only view of a dict (keep no other reference to d)
+- threading.Event().wait(timeout): Interruptible sleep for background pollers
+- os.stat(path).st_mtime_ns: Cheap change detection without reading the file
+
+Design Notes:
+- Double-checked locking is safe in CPython because the instance is fully initialized
+  before it's published to cls._instance
+- Copy-on-write turns a reader/writer problem into "readers never wait"
+- The GIL still serializes Python bytecode; lock-free reads avoid lock handoffs and
+  contention, they don't make reads run in parallel
+- Keep the last good config when a reload fails (partial writes, invalid JSON)
+
+Real-World Examples:
+1. Feature flags read on every request, toggled a few times a day
+2. Routing tables swapped atomically by a control-plane thread
+3. Watching /etc/app/config.json and applying changes without a restart
+"""
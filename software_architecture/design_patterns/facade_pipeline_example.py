@@ -0,0 +1,393 @@
+"""
+Pipelined Facade Concept (Facade pattern, concurrent):
+ComputerFacade.start and MediaConverter.convert_video in _structural_patterns.txt call their
+subsystems strictly one after another. The facade hides that order from the client, which
+is exactly what makes it a good place to optimize: steps that don't depend on each other
+can run at the same time, and the client never notices.
+
+This file models a facade as a DAG (directed acyclic graph) of steps:
+
+- TaskGraph: each step declares the steps it depends on. Ready steps run concurrently on a
+  thread pool; a step starts as soon as its own inputs are done. After a run you get the
+  per-step timings and the critical path - the chain of dependent steps that determined
+  the total time (speeding up anything else can't make the run faster).
+- StreamPipeline: for data that arrives in chunks (video frames, file blocks) a stage
+  doesn't have to wait for the whole input. Each stage runs in its own thread and passes
+  chunks to the next stage through a bounded queue.Queue, so decode of chunk 2 overlaps
+  with encode of chunk 1, and the bound keeps a fast stage from buffering everything in
+  memory (backpressure).
+
+The subsystems simulate work with time.sleep, which releases the GIL like real I/O or a
+C codec would. Pure-Python CPU work would need processes instead of threads.
+"""
+
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+# === DAG OF STEPS ===
+class StepTiming:
+    __slots__ = ("name", "start", "end")
+
+    def __init__(self, name, start, end):
+        self.name = name
+        self.start = start
+        self.end = end
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+class GraphResult:
+    """Outputs, timings and critical path of one TaskGraph run"""
+
+    def __init__(self, results, timings, critical_path, wall_time):
+        self.results = results
+        self.timings = timings
+        self.critical_path = critical_path
+        self.wall_time = wall_time
+
+    def report(self):
+        lines = [f"{'step':24} {'start ms':>9} {'took ms':>9}"]
+        for timing in sorted(self.timings.values(), key=lambda t: t.start):
+            marker = " *" if timing.name in self.critical_path else ""
+            lines.append(f"{timing.name:24} {timing.start * 1e3:9.1f} {timing.duration * 1e3:9.1f}{marker}")
+        lines.append(f"critical path (*): {' -> '.join(self.critical_path)}")
+        lines.append(f"wall time: {self.wall_time * 1e3:.1f} ms, "
+                     f"sum of steps: {sum(t.duration for t in self.timings.values()) * 1e3:.1f} ms")
+        return "\n".join(lines)
+
+
+class TaskGraph:
+    """
+    Steps with dependencies, run concurrently in dependency order.
+
+    A step's function receives the results of its dependencies as positional arguments,
+    in the order they were declared. Dependencies must be added before the steps that
+    use them, which also guarantees the graph has no cycles.
+    """
+
+    def __init__(self):
+        self._steps = {}  # name -> (func, deps), insertion order is a topological order
+
+    def add(self, name, func, *deps):
+        if name in self._steps:
+            raise ValueError(f"Duplicate step: {name}")
+        missing = [dep for dep in deps if dep not in self._steps]
+        if missing:
+            raise ValueError(f"Step {name!r} depends on unknown steps: {missing}")
+        self._steps[name] = (func, deps)
+        return self
+
+    def run(self, max_workers=8):
+        """
+        Execute every step; returns a GraphResult.
+
+        Raises:
+            Exception: The first exception raised by a step (pending steps are cancelled).
+        """
+        waiting_on = {name: len(deps) for name, (_, deps) in self._steps.items()}
+        dependents = {name: [] for name in self._steps}
+        for name, (_, deps) in self._steps.items():
+            for dep in deps:
+                dependents[dep].append(name)
+
+        results, timings = {}, {}
+        origin = time.perf_counter()
+
+        def execute(name):
+            func, deps = self._steps[name]
+            start = time.perf_counter() - origin
+            result = func(*(results[dep] for dep in deps))
+            timings[name] = StepTiming(name, start, time.perf_counter() - origin)
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Step") as pool:
+            running = {pool.submit(execute, name): name
+                       for name, count in waiting_on.items() if count == 0}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        for other in running:
+                            other.cancel()
+                        raise error
+                    results[name] = future.result()
+                    for dependent in dependents[name]:
+                        waiting_on[dependent] -= 1
+                        if waiting_on[dependent] == 0:
+                            running[pool.submit(execute, dependent)] = dependent
+
+        wall_time = time.perf_counter() - origin
+        return GraphResult(results, timings, self._critical_path(timings), wall_time)
+
+    def _critical_path(self, timings):
+        """Longest chain of dependent steps, weighted by their measured durations"""
+        longest, previous = {}, {}
+        for name, (_, deps) in self._steps.items():
+            before = max(deps, key=lambda dep: longest[dep], default=None)
+            longest[name] = timings[name].duration + (longest[before] if before else 0.0)
+            previous[name] = before
+        name = max(longest, key=longest.get)
+        path = []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+        return path[::-1]
+
+
+# === STREAMING STAGES WITH BOUNDED QUEUES ===
+class StageStats:
+    __slots__ = ("name", "items", "busy", "blocked")
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.busy = 0.0      # seconds inside the stage function
+        self.blocked = 0.0   # seconds waiting to hand a chunk to a full downstream queue
+
+
+_DONE = object()
+
+
+class StreamPipeline:
+    """
+    Chain of stages, one thread each, connected by bounded queues.
+
+    Args:
+        stages: (name, func) pairs; func maps one chunk to one chunk.
+        queue_size: Chunks buffered between two stages (backpressure bound).
+    """
+
+    def __init__(self, stages, queue_size=4):
+        self.stages = list(stages)
+        self.queue_size = queue_size
+
+    def run(self, source):
+        """Push every chunk of source through all stages; returns (outputs, stats)"""
+        queues = [queue.Queue(self.queue_size) for _ in range(len(self.stages) + 1)]
+        stats = [StageStats(name) for name, _ in self.stages]
+        errors = []
+
+        def feed():
+            try:
+                for chunk in source:
+                    if errors:
+                        break  # a stage failed: don't read the rest of the source
+                    queues[0].put(chunk)
+            except Exception as e:
+                errors.append(e)  # reported by run() like a stage failure
+            finally:
+                queues[0].put(_DONE)
+
+        def work(index, func):
+            inbox, outbox, stat = queues[index], queues[index + 1], stats[index]
+            while True:
+                chunk = inbox.get()
+                if chunk is _DONE:
+                    break
+                if errors:
+                    continue  # drain so upstream stages never block forever
+                try:
+                    start = time.perf_counter()
+                    chunk = func(chunk)
+                    stat.busy += time.perf_counter() - start
+                    stat.items += 1
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                start = time.perf_counter()
+                outbox.put(chunk)
+                stat.blocked += time.perf_counter() - start
+            outbox.put(_DONE)
+
+        threads = [threading.Thread(target=feed, name="Stage-source")]
+        threads += [threading.Thread(target=work, args=(i, func), name=f"Stage-{name}")
+                    for i, (name, func) in enumerate(self.stages)]
+        for thread in threads:
+            thread.start()
+        outputs = []
+        while True:
+            chunk = queues[-1].get()
+            if chunk is _DONE:
+                break
+            outputs.append(chunk)
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return outputs, stats
+
+
+# === SUBSYSTEMS (from _structural_patterns.txt, simulated latencies) ===
+class CPU:
+    def freeze(self):
+        time.sleep(0.010)
+        return "CPU frozen"
+
+    def jump(self, position):
+        time.sleep(0.002)
+        return f"CPU at {position}"
+
+    def execute(self):
+        time.sleep(0.005)
+        return "CPU executing"
+
+
+class Memory:
+    def clear(self):
+        time.sleep(0.015)
+        return "Memory cleared"
+
+    def load(self, position, data):
+        time.sleep(0.010)
+        return f"Loaded {data!r} at {position}"
+
+
+class HardDrive:
+    def read(self, lba, size):
+        time.sleep(0.030)
+        return f"Data from sector {lba}"
+
+
+class ComputerFacade:
+    def __init__(self):
+        self.cpu = CPU()
+        self.memory = Memory()
+        self.hard_drive = HardDrive()
+
+    def start(self):
+        """The original strictly sequential boot"""
+        self.cpu.freeze()
+        self.memory.clear()
+        boot_data = self.hard_drive.read(0, 1024)
+        self.memory.load(0, boot_data)
+        self.cpu.jump(0)
+        return self.cpu.execute()
+
+    def boot_graph(self):
+        """Same boot as a DAG: freeze, clear and the disk read don't depend on each other"""
+        return (TaskGraph()
+                .add("cpu.freeze", self.cpu.freeze)
+                .add("memory.clear", self.memory.clear)
+                .add("hard_drive.read", lambda: self.hard_drive.read(0, 1024))
+                .add("memory.load", lambda data, _cleared: self.memory.load(0, data),
+                     "hard_drive.read", "memory.clear")
+                .add("cpu.jump", lambda _frozen, _loaded: self.cpu.jump(0), "cpu.freeze", "memory.load")
+                .add("cpu.execute", lambda _jumped: self.cpu.execute(), "cpu.jump"))
+
+    def start_parallel(self):
+        return self.boot_graph().run()
+
+
+# Per-chunk costs of the simulated media workload (seconds)
+CHUNK_COSTS = {"read": 0.001, "video_decode": 0.003, "audio_decode": 0.001,
+               "video_encode": 0.004, "audio_encode": 0.001, "write": 0.001}
+
+
+class MediaConverter:
+    def __init__(self, chunks_per_file=10):
+        self.chunks_per_file = chunks_per_file
+
+    def _work(self, stage, chunks=1):
+        time.sleep(CHUNK_COSTS[stage] * chunks)
+
+    def convert_video(self, input_file, output_format):
+        """The original sequential facade: decode video, decode audio, encode, encode"""
+        n = self.chunks_per_file
+        for stage in ("read", "video_decode", "audio_decode", "video_encode", "audio_encode", "write"):
+            self._work(stage, n)
+        return f"{input_file.rsplit('.', 1)[0]}.{output_format}"
+
+    def add_to_graph(self, graph, input_file, output_format):
+        """Add one file's conversion as steps; the video and audio branches run in parallel"""
+        n, f = self.chunks_per_file, input_file
+        graph.add(f"{f}:read", lambda: self._work("read", n))
+        graph.add(f"{f}:video_decode", lambda _: self._work("video_decode", n), f"{f}:read")
+        graph.add(f"{f}:audio_decode", lambda _: self._work("audio_decode", n), f"{f}:read")
+        graph.add(f"{f}:video_encode", lambda _: self._work("video_encode", n), f"{f}:video_decode")
+        graph.add(f"{f}:audio_encode", lambda _: self._work("audio_encode", n), f"{f}:audio_decode")
+        graph.add(f"{f}:write", lambda *_: self._work("write", n),
+                  f"{f}:video_encode", f"{f}:audio_encode")
+        return graph
+
+    def streaming_pipeline(self, queue_size=4):
+        """Chunk-level pipeline: every stage works on a different chunk at the same time"""
+        def stage(name):
+            def run(chunk):
+                self._work(name)
+                return chunk
+            return name, run
+        return StreamPipeline([stage(name) for name in CHUNK_COSTS], queue_size=queue_size)
+
+
+# === BENCHMARK ===
+def run_benchmark(files=8, chunks_per_file=10, max_workers=8):
+    converter = MediaConverter(chunks_per_file)
+    names = [f"movie{i}.avi" for i in range(files)]
+    print(f"Converting {files} files x {chunks_per_file} chunks "
+          f"(per-chunk ms: {', '.join(f'{k}={v * 1e3:g}' for k, v in CHUNK_COSTS.items())})")
+
+    start = time.perf_counter()
+    for name in names:
+        converter.convert_video(name, "mp4")
+    sequential = time.perf_counter() - start
+    print(f"{'sequential facade':34} {sequential:6.2f}s")
+
+    graph = TaskGraph()
+    for name in names:
+        converter.add_to_graph(graph, name, "mp4")
+    result = graph.run(max_workers=max_workers)
+    print(f"{f'DAG, {max_workers} workers':34} {result.wall_time:6.2f}s  x{sequential / result.wall_time:.1f}")
+    print(f"  critical path: {' -> '.join(result.critical_path)}")
+
+    chunks = [(name, i) for name in names for i in range(chunks_per_file)]
+    start = time.perf_counter()
+    outputs, stats = converter.streaming_pipeline().run(chunks)
+    streamed = time.perf_counter() - start
+    print(f"{'streaming stages, queue_size=4':34} {streamed:6.2f}s  x{sequential / streamed:.1f}"
+          f"  ({len(outputs)} chunks)")
+    bottleneck = max(stats, key=lambda s: s.busy)
+    for stat in stats:
+        marker = "  <- bottleneck" if stat is bottleneck else ""
+        print(f"  {stat.name:14} items={stat.items:4} busy={stat.busy * 1e3:7.1f}ms "
+              f"blocked={stat.blocked * 1e3:7.1f}ms{marker}")
+
+
+if __name__ == "__main__":
+    print("--- ComputerFacade boot: sequential vs DAG ---")
+    computer = ComputerFacade()
+    start = time.perf_counter()
+    computer.start()
+    print(f"sequential boot: {(time.perf_counter() - start) * 1e3:.1f} ms")
+    print(computer.start_parallel().report())
+
+    print("\n--- Benchmark: simulated multi-file conversion ---")
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
+
+"""
+USEFUL CONCURRENCY/PIPELINE TOOLS AND EXAMPLES:
+
+Core Tools:
+- concurrent.futures.wait(futures, return_when=FIRST_COMPLETED): React as soon as any step finishes
+- queue.Queue(maxsize): Thread-safe bounded buffer; put() blocks when full (backpressure)
+- graphlib.TopologicalSorter: Standard-library topological sorting (Python 3.9+)
+- asyncio.gather / asyncio.Queue: The same patterns for async I/O
+
+Design Notes:
+- The critical path bounds the best possible wall time; optimize steps on it first
+- The slowest stage bounds a streaming pipeline's throughput; give it more workers
+- Bounded queues trade a little throughput for bounded memory
+- Threads help for I/O and GIL-releasing C code; use processes for pure-Python CPU work
+
+Real-World Examples:
+1. Build systems (make, Bazel): targets as a DAG, independent targets built in parallel
+2. ffmpeg: demux -> decode -> filter -> encode -> mux, each stage overlapping the others
+3. Service startup: open DB pool, warm caches and load config concurrently, then serve
+"""
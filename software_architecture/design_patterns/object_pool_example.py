@@ -0,0 +1,415 @@
+"""
+Object Pool and Interning Concept (Factory pattern, with reuse):
+AnimalFactory.create in _creational_patterns.txt builds a new object on every call, and the
+DatabaseConnection singleton gives the whole program exactly one connection. Real services
+sit between those two extremes:
+
+- Expensive, stateful resources (database connections, sockets, parsers with buffers) should
+  be created a limited number of times and reused: an object pool. Callers acquire() an
+  object, use it, and release() it; when the pool is empty and at its size limit, callers
+  wait (up to a timeout) instead of opening yet another connection.
+- Cheap but immutable products (a Dog that only says "Woof!", a parsed currency code)
+  don't need a pool at all: one shared instance per distinct set of arguments is enough.
+  That's interning, the same trick Python uses for small ints and identifiers.
+
+ObjectPool supports a max size, a max number of idle objects, a health check on
+acquire/release, wait timeouts and hit/wait/creation statistics. InternedFactory caches
+immutable products by their constructor arguments. Both are tested against FakeConnection
+in test_object_pool_example.py.
+"""
+
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PoolTimeout(Exception):
+    """Raised when no object becomes available within the acquire timeout"""
+
+
+class PoolStats:
+    """Counters for one pool; read them with as_dict()"""
+
+    __slots__ = ("acquires", "hits", "creations", "waits", "wait_time", "timeouts",
+                 "health_failures", "destroyed")
+
+    def __init__(self):
+        self.acquires = 0
+        self.hits = 0              # acquire served by an idle object
+        self.creations = 0
+        self.waits = 0             # acquire had to block for a release
+        self.wait_time = 0.0
+        self.timeouts = 0
+        self.health_failures = 0
+        self.destroyed = 0
+
+    def as_dict(self):
+        stats = {name: getattr(self, name) for name in self.__slots__}
+        stats["hit_rate"] = self.hits / self.acquires if self.acquires else 0.0
+        stats["avg_wait_ms"] = self.wait_time / self.waits * 1e3 if self.waits else 0.0
+        return stats
+
+
+# === OBJECT POOL ===
+class ObjectPool:
+    """
+    Thread-safe pool of reusable objects produced by a factory.
+
+    Args:
+        factory: Zero-argument callable that creates a new object.
+        max_size: Maximum objects alive at once (idle + in use).
+        max_idle: Idle objects kept; extras are destroyed on release.
+        health_check: Optional callable(obj) -> bool; unhealthy objects are destroyed.
+        destroy: Optional callable(obj) to close an object leaving the pool.
+        timeout: Default seconds acquire() waits when the pool is exhausted (None = forever).
+    """
+
+    def __init__(self, factory, max_size=10, max_idle=None, health_check=None,
+                 destroy=None, timeout=30.0):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.factory = factory
+        self.max_size = max_size
+        self.max_idle = max_size if max_idle is None else max_idle
+        self.health_check = health_check
+        self.destroy = destroy
+        self.timeout = timeout
+        self.stats = PoolStats()
+        self._idle = deque()      # LIFO: the most recently used object is the warmest
+        self._alive = 0           # idle + in use + being created
+        self._available = threading.Condition(threading.Lock())
+        self._closed = False
+
+    @property
+    def idle_count(self):
+        return len(self._idle)
+
+    @property
+    def in_use_count(self):
+        return self._alive - len(self._idle)
+
+    def acquire(self, timeout=-1):
+        """
+        Return an idle object, create one if below max_size, or wait for a release.
+
+        Raises:
+            PoolTimeout: If nothing is available within timeout seconds.
+        """
+        timeout = self.timeout if timeout == -1 else timeout
+        stats = self.stats
+        first_attempt = True
+        while True:
+            with self._available:
+                if self._closed:
+                    raise RuntimeError("pool is closed")
+                if first_attempt:
+                    stats.acquires += 1
+                    first_attempt = False
+                obj, create = self._take_or_reserve(timeout)
+            if create:
+                try:
+                    return self.factory()
+                except BaseException:
+                    with self._available:
+                        self._alive -= 1
+                        stats.creations -= 1
+                        self._available.notify()
+                    raise
+            if self.health_check is None or self.health_check(obj):
+                return obj
+            self._discard(obj, failed_hit=True)
+            # loop: try the next idle object or create a replacement
+
+    def _take_or_reserve(self, timeout):
+        """With the lock held: pop an idle object, or reserve a slot to create one"""
+        if self._idle:
+            self.stats.hits += 1
+            return self._idle.pop(), False
+        if self._alive < self.max_size:
+            self._alive += 1
+            self.stats.creations += 1
+            return None, True
+        self.stats.waits += 1
+        start = time.perf_counter()
+        deadline = None if timeout is None else start + timeout
+        while not self._idle and self._alive >= self.max_size:
+            if self._closed:
+                raise RuntimeError("pool is closed")
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                self.stats.timeouts += 1
+                self.stats.wait_time += time.perf_counter() - start
+                raise PoolTimeout(f"no object available after {timeout}s "
+                                  f"(max_size={self.max_size})")
+            self._available.wait(remaining)
+        self.stats.wait_time += time.perf_counter() - start
+        return self._take_or_reserve(timeout)
+
+    def release(self, obj, broken=False):
+        """Return obj to the pool; broken or surplus objects are destroyed"""
+        if broken:
+            self._discard(obj)
+            return
+        if self.health_check is not None and not self.health_check(obj):
+            self._discard(obj, failed_check=True)
+            return
+        with self._available:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(obj)
+                self._available.notify()
+                return
+        self._discard(obj)
+
+    @contextmanager
+    def lease(self, timeout=-1):
+        """with pool.lease() as conn: ... ; marks the object broken if the block raises"""
+        obj = self.acquire(timeout)
+        try:
+            yield obj
+        except BaseException:
+            self.release(obj, broken=True)
+            raise
+        else:
+            self.release(obj)
+
+    def close(self):
+        """Destroy idle objects; objects still in use are destroyed when released"""
+        with self._available:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._available.notify_all()
+        for obj in idle:
+            self._discard(obj)
+
+    def _discard(self, obj, failed_check=False, failed_hit=False):
+        with self._available:
+            self._alive -= 1
+            self.stats.destroyed += 1
+            if failed_check or failed_hit:
+                self.stats.health_failures += 1
+            if failed_hit:
+                self.stats.hits -= 1  # the idle object turned out to be unusable
+            self._available.notify()
+        if self.destroy is not None:
+            self.destroy(obj)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# === INTERNED FACTORY FOR IMMUTABLE PRODUCTS ===
+class InternedFactory:
+    """
+    Returns one shared instance per distinct (product, args) key.
+
+    Only use it for immutable products: every caller gets the same object.
+    """
+
+    def __init__(self, products):
+        self.products = dict(products)
+        self._instances = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.creations = 0
+
+    def create(self, product_type, *args):
+        key = (product_type, args)
+        instance = self._instances.get(key)  # lock-free fast path
+        if instance is not None:
+            self.hits += 1  # approximate under concurrency; fine for statistics
+            return instance
+        try:
+            cls = self.products[product_type]
+        except KeyError:
+            raise ValueError(f"Unknown type: {product_type}") from None
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is None:
+                instance = cls(*args)
+                self._instances[key] = instance
+                self.creations += 1
+        return instance
+
+
+# === PRODUCTS FROM _creational_patterns.txt ===
+class Animal:
+    __slots__ = ()
+
+    def speak(self):
+        pass
+
+class Dog(Animal):
+    __slots__ = ()
+
+    def speak(self):
+        return "Woof!"
+
+class Cat(Animal):
+    __slots__ = ()
+
+    def speak(self):
+        return "Meow!"
+
+
+class AnimalFactory:
+    """The original factory: a new object on every call"""
+
+    @staticmethod
+    def create(animal_type):
+        if animal_type == "dog":
+            return Dog()
+        elif animal_type == "cat":
+            return Cat()
+        else:
+            raise ValueError(f"Unknown type: {animal_type}")
+
+
+# === IN-PROCESS FAKE CONNECTION ===
+class FakeConnection:
+    """Stands in for a database connection: slow to open, cheap to query, can break"""
+
+    opened = 0
+    _counter_lock = threading.Lock()
+
+    def __init__(self, connect_delay=0.005):
+        time.sleep(connect_delay)  # TCP + TLS + auth handshake
+        with FakeConnection._counter_lock:
+            FakeConnection.opened += 1
+            self.id = FakeConnection.opened
+        self.alive = True
+        self.queries = 0
+
+    def query(self, sql):
+        if not self.alive:
+            raise ConnectionError(f"connection {self.id} is closed")
+        self.queries += 1
+        return f"conn{self.id}: {sql}"
+
+    def is_alive(self):
+        return self.alive
+
+    def close(self):
+        self.alive = False
+
+
+# === BENCHMARK ===
+def run_benchmark(threads=64, requests_per_thread=200, pool_size=16):
+    print(f"{threads} threads x {requests_per_thread} queries")
+
+    def hammer(get_result):
+        errors = []
+
+        def worker():
+            try:
+                for i in range(requests_per_thread):
+                    get_result(i)
+            except Exception as e:  # surface failures instead of losing them in threads
+                errors.append(e)
+
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        start = time.perf_counter()
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return time.perf_counter() - start
+
+    total = threads * requests_per_thread
+
+    FakeConnection.opened = 0
+
+    def new_connection_per_query(i):
+        conn = FakeConnection()
+        conn.query("SELECT 1")
+        conn.close()
+
+    elapsed = hammer(new_connection_per_query)
+    print(f"{'new connection per query':28} {elapsed:6.2f}s {total / elapsed:10,.0f} q/s  "
+          f"opened={FakeConnection.opened:,}")
+
+    FakeConnection.opened = 0
+    with ObjectPool(FakeConnection, max_size=pool_size, health_check=FakeConnection.is_alive,
+                    destroy=FakeConnection.close, timeout=10) as pool:
+        def pooled(i):
+            with pool.lease() as conn:
+                conn.query("SELECT 1")
+
+        elapsed = hammer(pooled)
+        stats = pool.stats.as_dict()
+    print(f"{f'pool (max_size={pool_size})':28} {elapsed:6.2f}s {total / elapsed:10,.0f} q/s  "
+          f"opened={FakeConnection.opened:,}")
+    print(f"  hit_rate={stats['hit_rate']:.1%} waits={stats['waits']:,} "
+          f"avg_wait={stats['avg_wait_ms']:.2f}ms creations={stats['creations']}")
+
+    factory = InternedFactory({"dog": Dog, "cat": Cat})
+    kinds = ["dog", "cat"] * 500_000
+    start = time.perf_counter()
+    products = [AnimalFactory.create(kind) for kind in kinds]
+    plain = time.perf_counter() - start
+    distinct = len({id(p) for p in products})
+    del products
+    start = time.perf_counter()
+    products = [factory.create(kind) for kind in kinds]
+    interned = time.perf_counter() - start
+    print(f"\n{len(kinds):,} animals: AnimalFactory {plain:.2f}s ({distinct:,} objects), "
+          f"InternedFactory {interned:.2f}s ({len({id(p) for p in products})} objects)")
+
+
+if __name__ == "__main__":
+    print("--- Pool reuse, health check and timeout ---")
+    pool = ObjectPool(lambda: FakeConnection(connect_delay=0), max_size=2,
+                      health_check=FakeConnection.is_alive, destroy=FakeConnection.close,
+                      timeout=0.1)
+    first = pool.acquire()
+    pool.release(first)
+    again = pool.acquire()
+    print(f"Reused same connection: {again is first}")  # True
+    second = pool.acquire()
+    try:
+        pool.acquire()
+    except PoolTimeout as e:
+        print(f"PoolTimeout: {e}")
+    again.close()               # simulate a dropped connection
+    pool.release(again)         # health check fails -> destroyed, slot freed
+    pool.release(second)
+    third = pool.acquire()
+    print(f"Got a healthy connection: {third.query('SELECT 1')}")
+    pool.release(third)
+    print(pool.stats.as_dict())
+
+    print("\n--- Interned factory ---")
+    animals = InternedFactory({"dog": Dog, "cat": Cat})
+    print(animals.create("dog") is animals.create("dog"), animals.create("cat").speak())  # True Meow!
+
+    print("\n--- Benchmark ---")
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 64)
+
+"""
+USEFUL POOLING TOOLS AND EXAMPLES:
+
+Core Tools:
+- threading.Condition: Wait for "an object was released" without busy-looping
+- collections.deque: O(1) push/pop at both ends for the idle list
+- contextlib.contextmanager: with pool.lease() as conn - release is never forgotten
+- queue.Queue(maxsize): Simpler pool when you don't need health checks or stats
+
+Design Notes:
+- Create objects outside the lock; only reserve the slot while holding it
+- LIFO reuse keeps a few connections hot and lets the rest idle out
+- Health-check on acquire AND release; a broken object must never go back to the pool
+- Pool size should match what the backend can serve, not the number of threads
+- Interning is only safe for immutable products (shared state would leak between callers)
+
+Real-World Examples:
+1. SQLAlchemy QueuePool / psycopg_pool: pool_size, max_overflow, pool_timeout, pre_ping
+2. HTTP keep-alive pools in urllib3/requests Session
+3. sys.intern(string), small-int cache, enum members: interned immutable values
+"""
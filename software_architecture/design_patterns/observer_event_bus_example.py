@@ -0,0 +1,527 @@
+"""
+Event Bus Concept (Observer pattern, scaled up):
+The Observer example in _behavioral_patterns.txt has three problems once it carries real
+traffic:
+
+1. Subject.notify() calls every observer.update() synchronously, so one slow observer
+   blocks the publisher and every observer after it.
+2. _observers holds strong references: an observer that is no longer used elsewhere stays
+   alive (and keeps receiving messages) until someone remembers to detach it.
+3. Every observer receives every message, one call per message.
+
+EventBus keeps the same Subject/Observer/NewsAgency vocabulary and fixes them:
+
+- Topic-indexed subscriptions: publish("sports", ...) only touches "sports" subscribers
+  (plus "*" wildcard subscribers). Subscriber lists are immutable tuples replaced on
+  attach/detach, so publishing never takes a global lock.
+- Weak references: observers are held with weakref.ref and disappear automatically once
+  garbage collected.
+- Delivery modes: "sync" (in the publisher's thread), "thread" (a ThreadPoolExecutor, each
+  observer drains its own mailbox so order is kept per observer) and AsyncEventBus (one
+  asyncio queue + consumer task per observer).
+- Micro-batching: messages are buffered per observer and handed over as a list through
+  update_batch(), amortizing the per-call overhead.
+- Metrics: per observer message/batch counts, time spent inside the observer, queue
+  latency (publish -> delivery) and errors. An observer that raises is counted and skipped,
+  it never stops delivery to itself or to the others.
+"""
+
+import sys
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+ALL_TOPICS = "*"
+
+
+# === OBSERVER INTERFACE ===
+class Observer(ABC):
+    @abstractmethod
+    def update(self, message):
+        pass
+
+    def update_batch(self, messages):
+        """Receive several messages at once; override for a faster bulk path"""
+        for message in messages:
+            self.update(message)
+
+
+class ObserverMetrics:
+    """Delivery statistics for one observer"""
+
+    __slots__ = ("messages", "batches", "busy_time", "max_call_time",
+                 "total_latency", "max_latency", "errors", "last_error")
+
+    def __init__(self):
+        self.messages = 0
+        self.batches = 0
+        self.busy_time = 0.0       # seconds spent inside the observer
+        self.max_call_time = 0.0
+        self.total_latency = 0.0   # publish -> delivery start, summed over messages
+        self.max_latency = 0.0
+        self.errors = 0
+        self.last_error = None
+
+    def record(self, batch_size, oldest_publish_time, started, finished):
+        call_time = finished - started
+        latency = started - oldest_publish_time
+        self.messages += batch_size
+        self.batches += 1
+        self.busy_time += call_time
+        self.total_latency += latency * batch_size
+        self.max_call_time = max(self.max_call_time, call_time)
+        self.max_latency = max(self.max_latency, latency)
+
+    def record_error(self, error):
+        self.errors += 1
+        self.last_error = error
+
+    def as_dict(self):
+        avg_latency = self.total_latency / self.messages if self.messages else 0.0
+        return {
+            "messages": self.messages,
+            "batches": self.batches,
+            "avg_latency_ms": avg_latency * 1e3,
+            "max_latency_ms": self.max_latency * 1e3,
+            "busy_ms": self.busy_time * 1e3,
+            "max_call_ms": self.max_call_time * 1e3,
+            "errors": self.errors,
+        }
+
+
+class _Subscription:
+    """One observer on one topic: weak reference, mailbox and metrics"""
+
+    __slots__ = ("ref", "name", "topic", "mailbox", "lock", "scheduled", "metrics", "__weakref__")
+
+    def __init__(self, observer, topic, on_dead):
+        self.ref = weakref.ref(observer, lambda _ref: on_dead(self))
+        self.name = f"{type(observer).__name__}@{id(observer):x}"
+        self.topic = topic
+        self.mailbox = deque()  # (publish_time, message) envelopes
+        self.lock = threading.Lock()
+        self.scheduled = False
+        self.metrics = ObserverMetrics()
+
+
+class _TopicRegistry:
+    """Topic -> tuple of subscriptions, rebuilt copy-on-write on attach/detach"""
+
+    def __init__(self):
+        self._topics = {}
+        self._registry_lock = threading.Lock()
+        self._all = weakref.WeakSet()  # live subscriptions, for flush() and metrics()
+
+    def attach(self, observer, topic=ALL_TOPICS):
+        subscription = _Subscription(observer, topic, self._remove)
+        with self._registry_lock:
+            self._topics[topic] = self._topics.get(topic, ()) + (subscription,)
+            self._all.add(subscription)
+        return subscription
+
+    def detach(self, observer, topic=None):
+        """Detach observer from topic (or from every topic when topic is None)"""
+        for subscription in list(self._all):
+            if subscription.ref() is observer and topic in (None, subscription.topic):
+                self._remove(subscription)
+
+    def _remove(self, subscription):
+        with self._registry_lock:
+            current = self._topics.get(subscription.topic, ())
+            remaining = tuple(s for s in current if s is not subscription)
+            if remaining:
+                self._topics[subscription.topic] = remaining
+            else:
+                self._topics.pop(subscription.topic, None)
+
+    def subscribers(self, topic):
+        topics = self._topics
+        if topic == ALL_TOPICS:
+            return topics.get(ALL_TOPICS, ())
+        return topics.get(topic, ()) + topics.get(ALL_TOPICS, ())
+
+    def subscriber_count(self, topic=None):
+        if topic is None:
+            return sum(len(subs) for subs in self._topics.values())
+        return len(self.subscribers(topic))
+
+    def metrics(self):
+        return {f"{s.name}[{s.topic}]": s.metrics.as_dict() for s in self._all}
+
+
+def _call_observer(observer, batch):
+    if len(batch) == 1:
+        return observer.update(batch[0][1])
+    return observer.update_batch([message for _, message in batch])
+
+
+def _deliver(subscription, batch):
+    observer = subscription.ref()
+    if observer is None:
+        return
+    started = time.perf_counter()
+    try:
+        _call_observer(observer, batch)
+    except Exception as error:
+        subscription.metrics.record_error(error)
+        return
+    subscription.metrics.record(len(batch), batch[0][0], started, time.perf_counter())
+
+
+# === THREAD / SYNC EVENT BUS ===
+class EventBus(_TopicRegistry):
+    """
+    Topic-based publish/subscribe with weak observers and micro-batching.
+
+    Args:
+        mode: "sync" delivers in the publisher's thread, "thread" on a worker pool.
+        batch_size: Messages buffered per observer before delivery (1 = no batching).
+        max_delay: Deliver a partial batch once its oldest message is this old (seconds),
+            checked on publish; call flush() to deliver whatever is left.
+        max_workers: Pool size for "thread" mode.
+    """
+
+    def __init__(self, mode="sync", batch_size=1, max_delay=0.05, max_workers=4):
+        super().__init__()
+        if mode not in ("sync", "thread"):
+            raise ValueError(f"Unknown delivery mode: {mode}")
+        self.mode = mode
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="EventBus") \
+            if mode == "thread" else None
+        # Sync delivery without batching doesn't need the mailbox at all
+        self._direct = mode == "sync" and batch_size <= 1
+
+    def publish(self, topic, message):
+        """Queue message for every subscriber of topic; returns the number of subscribers"""
+        subscribers = self.subscribers(topic)
+        now = time.perf_counter()
+        envelope = (now, message)
+        if self._direct:
+            batch = (envelope,)
+            for subscription in subscribers:
+                _deliver(subscription, batch)
+            return len(subscribers)
+        for subscription in subscribers:
+            mailbox = subscription.mailbox
+            mailbox.append(envelope)
+            if len(mailbox) >= self.batch_size:
+                self._schedule(subscription)
+                continue
+            # A worker may popleft() between the append and this read; the lock would cost
+            # more than the whole publish, and an emptied mailbox has nothing overdue
+            try:
+                oldest = mailbox[0][0]
+            except IndexError:
+                continue
+            if now - oldest >= self.max_delay:
+                self._schedule(subscription)
+        return len(subscribers)
+
+    def flush(self, wait=True):
+        """Deliver every pending message; in thread mode optionally wait until done"""
+        for subscription in list(self._all):
+            if subscription.mailbox:
+                self._schedule(subscription)
+        if wait and self._executor is not None:
+            while any(s.scheduled or s.mailbox for s in self._all if s.ref() is not None):
+                time.sleep(0.001)
+
+    def close(self):
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _schedule(self, subscription):
+        if self._executor is None:
+            self._drain(subscription)
+            return
+        with subscription.lock:
+            if subscription.scheduled:
+                return  # the running drain will pick up the new messages
+            subscription.scheduled = True
+        self._executor.submit(self._drain, subscription)
+
+    def _drain(self, subscription):
+        mailbox = subscription.mailbox
+        while True:
+            with subscription.lock:
+                if not mailbox:
+                    subscription.scheduled = False
+                    return
+                batch = [mailbox.popleft() for _ in range(min(self.batch_size, len(mailbox)))]
+            _deliver(subscription, batch)
+
+
+# === ASYNCIO EVENT BUS ===
+class AsyncEventBus(_TopicRegistry):
+    """
+    One asyncio.Queue and consumer task per observer; update()/update_batch() may be
+    regular methods or coroutines. publish() never awaits, so it can't be slowed down
+    by observers. Use inside a running event loop.
+
+    asyncio is imported inside the methods: it costs more to import than the rest of this
+    module together, and the sync/thread buses don't need it.
+    """
+
+    def __init__(self, batch_size=1):
+        super().__init__()
+        self.batch_size = batch_size
+        self._consumers = {}  # subscription -> (queue, consumer task)
+
+    def attach(self, observer, topic=ALL_TOPICS):
+        import asyncio
+
+        subscription = super().attach(observer, topic)
+        queue = asyncio.Queue()
+        task = asyncio.get_running_loop().create_task(self._consume(subscription, queue))
+        self._consumers[subscription] = (queue, task)
+        return subscription
+
+    def _remove(self, subscription):
+        """Unsubscribe, then stop the consumer task and forget its queue"""
+        super()._remove(subscription)
+        consumer = self._consumers.pop(subscription, None)
+        if consumer is None:
+            return
+        queue, task = consumer
+        task.cancel()
+        while not queue.empty():  # nobody will deliver these: don't let drain() wait for them
+            queue.get_nowait()
+            queue.task_done()
+
+    def publish(self, topic, message):
+        subscribers = self.subscribers(topic)
+        envelope = (time.perf_counter(), message)
+        for subscription in subscribers:
+            consumer = self._consumers.get(subscription)
+            if consumer is not None:
+                consumer[0].put_nowait(envelope)
+        return len(subscribers)
+
+    async def drain(self):
+        """Wait until every queued message has been delivered"""
+        import asyncio
+
+        await asyncio.gather(*(queue.join() for queue, _ in list(self._consumers.values())))
+
+    async def close(self):
+        import asyncio
+
+        await self.drain()
+        tasks = [task for _, task in self._consumers.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _consume(self, subscription, queue):
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            observer = subscription.ref()
+            started = time.perf_counter()
+            try:
+                if observer is not None:
+                    result = _call_observer(observer, batch)
+                    if hasattr(result, "__await__"):  # coroutine observer: time the await too
+                        await result
+            except Exception as error:
+                subscription.metrics.record_error(error)
+            else:
+                if observer is not None:
+                    subscription.metrics.record(len(batch), batch[0][0], started, time.perf_counter())
+            finally:
+                observer = None  # don't keep a dead observer alive while waiting for the next batch
+                for _ in batch:
+                    queue.task_done()
+
+
+# === CONCRETE OBSERVERS AND SUBJECT (from _behavioral_patterns.txt) ===
+class EmailNotifier(Observer):
+    def __init__(self):
+        self.outbox = []
+
+    def update(self, message):
+        self.outbox.append(f"Email: {message}")
+
+    def update_batch(self, messages):
+        self.outbox.append(f"Email digest: {len(messages)} stories")
+
+
+class SlowAnalytics(Observer):
+    """Simulates an observer doing I/O for every call"""
+
+    def __init__(self, delay=0.001):
+        self.delay = delay
+        self.seen = 0
+
+    def update(self, message):
+        time.sleep(self.delay)
+        self.seen += 1
+
+    def update_batch(self, messages):
+        time.sleep(self.delay)  # one round trip for the whole batch
+        self.seen += len(messages)
+
+
+class Counter(Observer):
+    def __init__(self):
+        self.count = 0
+
+    def update(self, message):
+        self.count += 1
+
+    def update_batch(self, messages):
+        self.count += len(messages)
+
+
+class NewsAgency:
+    """Concrete subject publishing through an EventBus instead of its own observer list"""
+
+    def __init__(self, bus):
+        self.bus = bus
+
+    def set_news(self, news, topic="general"):
+        self.bus.publish(topic, f"Breaking News: {news}")
+
+
+# === BENCHMARK ===
+class _NaiveSubject:
+    """The original Subject.notify loop, for comparison"""
+
+    def __init__(self):
+        self._observers = []
+
+    def attach(self, observer):
+        self._observers.append(observer)
+
+    def notify(self, message):
+        for observer in self._observers:
+            observer.update(message)
+
+
+def run_benchmark(messages=100_000, fan_out=50):
+    import asyncio
+
+    print(f"Fan-out: {messages:,} messages x {fan_out} observers")
+
+    def report(label, elapsed, delivered):
+        print(f"{label:38} {elapsed:7.2f}s  {delivered / elapsed:12,.0f} deliveries/s")
+
+    counters = [Counter() for _ in range(fan_out)]
+    subject = _NaiveSubject()
+    for counter in counters:
+        subject.attach(counter)
+    start = time.perf_counter()
+    for i in range(messages):
+        subject.notify(i)
+    report("naive Subject.notify", time.perf_counter() - start, messages * fan_out)
+
+    for batch_size in (1, 64):
+        counters = [Counter() for _ in range(fan_out)]
+        bus = EventBus(batch_size=batch_size, max_delay=float("inf"))
+        for counter in counters:
+            bus.attach(counter, "news")
+        start = time.perf_counter()
+        for i in range(messages):
+            bus.publish("news", i)
+        bus.flush()
+        report(f"EventBus sync, batch={batch_size}", time.perf_counter() - start,
+               sum(c.count for c in counters))
+
+    # One slow observer: the naive loop blocks, the threaded bus doesn't
+    slow_messages = 500
+    subject = _NaiveSubject()
+    subject.attach(SlowAnalytics())
+    start = time.perf_counter()
+    for i in range(slow_messages):
+        subject.notify(i)
+    print(f"\nSlow observer (1ms/call), {slow_messages} messages:")
+    print(f"{'naive publisher blocked for':38} {time.perf_counter() - start:7.3f}s")
+
+    slow = SlowAnalytics()
+    with EventBus(mode="thread", batch_size=32, max_delay=0.01) as bus:
+        bus.attach(slow, "news")
+        start = time.perf_counter()
+        for i in range(slow_messages):
+            bus.publish("news", i)
+        print(f"{'threaded bus publisher blocked for':38} {time.perf_counter() - start:7.3f}s")
+        bus.flush()
+        print(f"{'threaded bus all delivered after':38} {time.perf_counter() - start:7.3f}s"
+              f"  ({slow.seen} seen)")
+
+    async def async_run():
+        counters = [Counter() for _ in range(fan_out)]
+        bus = AsyncEventBus(batch_size=64)
+        for counter in counters:
+            bus.attach(counter, "news")
+        start = time.perf_counter()
+        for i in range(messages):
+            bus.publish("news", i)
+            if i % 1024 == 0:
+                await asyncio.sleep(0)  # let consumers run, keeps queues short
+        await bus.close()
+        return time.perf_counter() - start, sum(c.count for c in counters)
+
+    print()
+    report("AsyncEventBus, batch=64", *asyncio.run(async_run()))
+
+
+if __name__ == "__main__":
+    print("--- Topics, batching and weak references ---")
+    bus = EventBus(batch_size=2)
+    email = EmailNotifier()
+    sports_fan = Counter()
+    bus.attach(email)                    # wildcard: every topic
+    bus.attach(sports_fan, "sports")
+    agency = NewsAgency(bus)
+    agency.set_news("Python 4.0 Released!", topic="tech")
+    agency.set_news("Local team wins", topic="sports")
+    agency.set_news("Rain expected", topic="weather")
+    bus.flush()
+    print(email.outbox)       # ['Email digest: 2 stories', 'Email: Breaking News: Rain expected']
+    print(sports_fan.count)   # 1
+
+    print(f"Subscribers before del: {bus.subscriber_count()}")  # 2
+    del sports_fan
+    print(f"Subscribers after del:  {bus.subscriber_count()}")  # 1 (weakref cleaned up)
+
+    print("\n--- Metrics ---")
+    for name, stats in bus.metrics().items():
+        print(name, {key: round(value, 3) for key, value in stats.items()})
+
+    print("\n--- Benchmark ---")
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
+
+"""
+USEFUL EVENT BUS TOOLS AND EXAMPLES:
+
+Core Tools:
+- weakref.ref(obj, callback): Reference that doesn't keep obj alive; callback runs on collection
+- weakref.WeakSet / WeakKeyDictionary: Containers that drop entries automatically
+- concurrent.futures.ThreadPoolExecutor: Run blocking observers off the publisher's thread
+- asyncio.Queue + one task per consumer: Isolate slow async consumers from each other
+- collections.deque: Thread-safe append/popleft for per-observer mailboxes
+
+Design Notes:
+- Copy-on-write subscriber tuples make publish() lock-free for readers
+- Per-observer mailboxes keep message order per observer even with a thread pool
+- Batching trades latency (max_delay) for throughput (fewer calls per message)
+- Unbounded queues hide slow consumers; in production add a bound and a drop/backpressure policy
+
+Real-World Examples:
+1. UI events: widgets subscribe to "click"/"resize" topics and are collected with the window
+2. Domain events: order_placed -> email, analytics, inventory, each in its own mailbox
+3. Log shipping: batch 500 records per HTTP request instead of one request per record
+"""
@@ -0,0 +1,205 @@
+"""
+Object Pool Tests:
+Behaviour checks for ObjectPool and InternedFactory in object_pool_example.py, run against
+the in-process FakeConnection: reuse, wait timeouts, health-check replacement on acquire
+and release, max_idle, failed creations, close(), and the statistics under concurrency.
+
+Run with: python -m unittest software_architecture.design_patterns.test_object_pool_example
+"""
+
+import threading
+import time
+import unittest
+
+try:
+    from .object_pool_example import Cat, Dog, FakeConnection, InternedFactory, ObjectPool, PoolTimeout
+except ImportError:  # run as a script: python test_object_pool_example.py
+    from object_pool_example import Cat, Dog, FakeConnection, InternedFactory, ObjectPool, PoolTimeout
+
+
+class TestObjectPool(unittest.TestCase):
+    """ObjectPool against FakeConnection (connect_delay=0 keeps the tests fast)"""
+
+    def setUp(self):
+        self.created = []
+        self.destroyed = []
+
+    def make_pool(self, **options):
+        def factory():
+            conn = FakeConnection(connect_delay=0)
+            self.created.append(conn)
+            return conn
+
+        def destroy(conn):
+            conn.close()
+            self.destroyed.append(conn)
+
+        options.setdefault("health_check", FakeConnection.is_alive)
+        options.setdefault("timeout", 1.0)
+        return ObjectPool(factory, destroy=destroy, **options)
+
+    def test_release_then_acquire_reuses_the_object(self):
+        pool = self.make_pool(max_size=2)
+        first = pool.acquire()
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual((pool.stats.acquires, pool.stats.hits, pool.stats.creations), (2, 1, 1))
+
+    def test_acquire_times_out_when_exhausted(self):
+        pool = self.make_pool(max_size=1)
+        pool.acquire()
+        start = time.perf_counter()
+        with self.assertRaises(PoolTimeout):
+            pool.acquire(timeout=0.05)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+        self.assertEqual((pool.stats.waits, pool.stats.timeouts), (1, 1))
+        self.assertEqual(len(self.created), 1)
+
+    def test_waiting_acquire_gets_the_released_object(self):
+        pool = self.make_pool(max_size=1)
+        conn = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=(conn,))
+        timer.start()
+        self.assertIs(pool.acquire(timeout=1.0), conn)
+        timer.join()
+        self.assertEqual(pool.stats.waits, 1)
+        self.assertEqual(pool.stats.timeouts, 0)
+
+    def test_unhealthy_release_is_destroyed_and_replaced(self):
+        pool = self.make_pool(max_size=1)
+        conn = pool.acquire()
+        conn.close()  # dropped by the server while in use
+        pool.release(conn)
+        self.assertEqual(self.destroyed, [conn])
+        self.assertEqual(pool.idle_count, 0)
+        replacement = pool.acquire(timeout=0.1)  # the slot was freed
+        self.assertIsNot(replacement, conn)
+        self.assertEqual(replacement.query("SELECT 1")[-8:], "SELECT 1")
+        self.assertEqual(pool.stats.health_failures, 1)
+
+    def test_unhealthy_idle_object_is_replaced_on_acquire(self):
+        pool = self.make_pool(max_size=1)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.close()  # went stale while idle
+        replacement = pool.acquire()
+        self.assertIsNot(replacement, conn)
+        self.assertTrue(replacement.is_alive())
+        self.assertEqual(self.destroyed, [conn])
+        stats = pool.stats
+        self.assertEqual((stats.health_failures, stats.hits, stats.creations), (1, 0, 2))
+
+    def test_max_idle_destroys_surplus_objects(self):
+        pool = self.make_pool(max_size=4, max_idle=1)
+        conns = [pool.acquire() for _ in range(3)]
+        for conn in conns:
+            pool.release(conn)
+        self.assertEqual(pool.idle_count, 1)
+        self.assertEqual(pool.in_use_count, 0)
+        self.assertEqual(len(self.destroyed), 2)
+        self.assertIs(pool.acquire(), conns[0])  # the first release was kept
+
+    def test_lease_marks_object_broken_when_block_raises(self):
+        pool = self.make_pool(max_size=1)
+        with self.assertRaises(ConnectionError):
+            with pool.lease() as conn:
+                raise ConnectionError("lost")
+        self.assertEqual(self.destroyed, [conn])
+        self.assertIsNot(pool.acquire(timeout=0.1), conn)
+
+    def test_failed_creation_frees_its_slot(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("connection refused")
+            return FakeConnection(connect_delay=0)
+
+        pool = ObjectPool(flaky, max_size=1, timeout=0.1)
+        with self.assertRaises(OSError):
+            pool.acquire()
+        self.assertTrue(pool.acquire().is_alive())
+        self.assertEqual(pool.stats.creations, 1)
+
+    def test_close_destroys_idle_objects_and_wakes_waiters(self):
+        pool = self.make_pool(max_size=2, timeout=None)
+        idle, busy = pool.acquire(), pool.acquire()
+        pool.release(idle)
+        pool.acquire()  # takes `idle` back, pool is now exhausted
+        errors = []
+
+        def waiter():
+            try:
+                pool.acquire()
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        pool.close()
+        thread.join(timeout=1.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 1)
+        pool.release(busy)  # released after close: destroyed, not pooled
+        self.assertIn(busy, self.destroyed)
+        self.assertEqual(pool.idle_count, 0)
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+    def test_stats_and_limits_under_concurrency(self):
+        threads, leases, max_size = 16, 200, 4
+        pool = self.make_pool(max_size=max_size, timeout=5.0)
+        lock = threading.Lock()
+        in_use = peak = 0
+        errors = []
+
+        def worker():
+            nonlocal in_use, peak
+            try:
+                for _ in range(leases):
+                    with pool.lease() as conn:
+                        with lock:
+                            in_use += 1
+                            peak = max(peak, in_use)
+                        conn.query("SELECT 1")
+                        with lock:
+                            in_use -= 1
+            except Exception as e:
+                errors.append(e)
+
+        pool_threads = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in pool_threads:
+            thread.start()
+        for thread in pool_threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(peak, max_size)
+        self.assertLessEqual(len(self.created), max_size)
+        self.assertEqual(sum(conn.queries for conn in self.created), threads * leases)
+        stats = pool.stats
+        self.assertEqual(stats.acquires, threads * leases)
+        self.assertEqual(stats.hits + stats.creations, stats.acquires)
+        self.assertEqual((stats.timeouts, stats.health_failures), (0, 0))
+        self.assertEqual(pool.in_use_count, 0)
+        self.assertEqual(pool.idle_count, len(self.created))
+
+
+class TestInternedFactory(unittest.TestCase):
+    def test_same_arguments_share_one_instance(self):
+        factory = InternedFactory({"dog": Dog, "cat": Cat})
+        self.assertIs(factory.create("dog"), factory.create("dog"))
+        self.assertIsNot(factory.create("dog"), factory.create("cat"))
+        self.assertEqual(factory.create("cat").speak(), "Meow!")
+        self.assertEqual(factory.creations, 2)
+
+    def test_unknown_type_raises(self):
+        with self.assertRaises(ValueError):
+            InternedFactory({"dog": Dog}).create("cow")
+
+
+if __name__ == "__main__":
+    unittest.main()
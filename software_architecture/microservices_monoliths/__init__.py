@@ -0,0 +1,6 @@
+"""Monolith vs microservices comparisons."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["checkout_topologies_example"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
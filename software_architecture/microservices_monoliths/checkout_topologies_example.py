@@ -0,0 +1,468 @@
+"""
+Monolith vs Microservices Overhead Concept:
+_microservices_vs_monolith.txt says monoliths make "direct method calls (fastest)" while
+microservices pay "network and latency overhead". This harness puts numbers on that by
+running the same checkout workflow (ShoppingCart + PaymentStrategy from
+_behavioral_patterns.txt) over three topologies:
+
+- direct: CartService and PaymentService are objects in the same process (the monolith).
+- queue:  each service runs in its own process; requests and responses are pickled over a
+          multiprocessing Pipe (local IPC, like a sidecar or a message queue on one host).
+- http:   each service runs its own HTTP/1.1 server process; requests are JSON over
+          keep-alive localhost TCP (microservices without the real network).
+
+Every checkout is two service calls (cart total, then payment), and each can be sent:
+
+- sequentially: one request, wait for the response, next request (2 round trips per order)
+- batched:      one message carries N requests, one response carries N results
+- pipelined:    up to N separate requests in flight on the same connection; responses
+                come back in order while later requests are still being sent
+
+Latency is measured per group of orders (a single order when sequential): the time
+from sending the group's first request to receiving its last response.
+
+A service that raises (e.g. KeyError for an unknown SKU) stays up and answers with an
+error; every transport turns it into the same ServiceError on the caller's side.
+"""
+
+import json
+import multiprocessing
+import random
+import socket
+import statistics
+import sys
+import time
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# === SERVICES (Strategy pattern from _behavioral_patterns.txt) ===
+class PaymentStrategy(ABC):
+    @abstractmethod
+    def pay(self, amount):
+        pass
+
+
+class CreditCardPayment(PaymentStrategy):
+    def pay(self, amount):
+        return f"Paid ${amount:.2f} via Credit Card"
+
+
+class PayPalPayment(PaymentStrategy):
+    def pay(self, amount):
+        return f"Paid ${amount:.2f} via PayPal"
+
+
+class CartService:
+    methods = ("total",)
+    CATALOG = {"book": 12.5, "pen": 1.25, "mug": 8.0, "lamp": 35.0, "desk": 240.0}
+
+    def total(self, items):
+        """items: [[sku, quantity], ...]"""
+        return round(sum(self.CATALOG[sku] * quantity for sku, quantity in items), 2)
+
+
+class PaymentService:
+    methods = ("pay",)
+    STRATEGIES = {"card": CreditCardPayment(), "paypal": PayPalPayment()}
+
+    def pay(self, request):
+        """request: {"amount": float, "method": "card" | "paypal"}"""
+        return self.STRATEGIES[request["method"]].pay(request["amount"])
+
+
+SERVICES = {"cart": CartService, "payment": PaymentService}
+
+
+class ServiceError(Exception):
+    """A service call raised; same type and text whichever transport carried it"""
+
+    def __init__(self, error_type, message):
+        super().__init__(error_type, message)  # args must match __init__ to survive pickling
+        self.error_type = error_type
+        self.message = message
+
+    def __str__(self):
+        return f"{self.error_type}: {self.message}"
+
+    @classmethod
+    def from_exception(cls, error):
+        return cls(type(error).__name__, str(error))
+
+
+def _bind_methods(service_name):
+    service = SERVICES[service_name]()
+    return {name: getattr(service, name) for name in service.methods}
+
+
+# === TRANSPORTS ===
+class Transport(ABC):
+    """How ShoppingCart reaches a service: call one, call a batch, or pipeline many"""
+
+    name = "abstract"
+
+    @abstractmethod
+    def call(self, service, method, payload):
+        pass
+
+    def call_batch(self, service, method, payloads):
+        """One request message carrying all payloads"""
+        return [self.call(service, method, payload) for payload in payloads]
+
+    def call_pipelined(self, service, method, payloads, depth):
+        """Separate requests, up to `depth` in flight at once"""
+        return [self.call(service, method, payload) for payload in payloads]
+
+    def close(self):
+        pass
+
+
+class DirectTransport(Transport):
+    """Monolith: plain method calls"""
+
+    name = "direct"
+
+    def __init__(self):
+        self._methods = {name: _bind_methods(name) for name in SERVICES}
+
+    def call(self, service, method, payload):
+        try:
+            return self._methods[service][method](payload)
+        except Exception as e:
+            raise ServiceError.from_exception(e) from e
+
+    def call_batch(self, service, method, payloads):
+        handler = self._methods[service][method]
+        try:
+            return [handler(payload) for payload in payloads]
+        except Exception as e:
+            raise ServiceError.from_exception(e) from e
+
+
+def _queue_service_main(conn, service_name):
+    """Service process for QueueTransport: (kind, method, payload) in, result or ServiceError out"""
+    methods = _bind_methods(service_name)
+    while True:
+        message = conn.recv()
+        if message is None:
+            return
+        kind, method, payload = message
+        try:
+            handler = methods[method]
+            reply = handler(payload) if kind == "one" else [handler(p) for p in payload]
+        except Exception as e:
+            reply = ServiceError.from_exception(e)  # keep serving the next request
+        conn.send(reply)
+
+
+class QueueTransport(Transport):
+    """One process per service, pickled messages over a duplex Pipe (FIFO, so in-order)"""
+
+    name = "queue"
+
+    def __init__(self):
+        self._conns, self._processes = {}, []
+        for service_name in SERVICES:
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_queue_service_main, args=(child, service_name), daemon=True)
+            process.start()
+            self._conns[service_name] = parent
+            self._processes.append(process)
+
+    def call(self, service, method, payload):
+        conn = self._conns[service]
+        conn.send(("one", method, payload))
+        return self._receive(conn)
+
+    def call_batch(self, service, method, payloads):
+        conn = self._conns[service]
+        conn.send(("batch", method, payloads))
+        return self._receive(conn)
+
+    def call_pipelined(self, service, method, payloads, depth):
+        conn = self._conns[service]
+        return _sliding_window(payloads, depth, lambda payload: conn.send(("one", method, payload)),
+                               lambda: self._receive(conn))
+
+    @staticmethod
+    def _receive(conn):
+        reply = conn.recv()
+        if isinstance(reply, ServiceError):
+            raise reply
+        return reply
+
+    def close(self):
+        for conn in self._conns.values():
+            conn.send(None)
+        for process in self._processes:
+            process.join()
+
+
+def _sliding_window(payloads, depth, send, receive):
+    """
+    Keep up to depth requests outstanding; responses arrive in request order.
+
+    After a ServiceError no new requests are sent, but the ones in flight are still read
+    (their responses would otherwise be taken as answers to the next call), then the
+    first error is raised.
+    """
+    results = []
+    error = None
+    sent = received = 0
+    while sent < min(depth, len(payloads)):
+        send(payloads[sent])
+        sent += 1
+    while received < sent:
+        try:
+            results.append(receive())
+        except ServiceError as e:
+            error = error or e
+        received += 1
+        if error is None and sent < len(payloads):
+            send(payloads[sent])
+            sent += 1
+    if error is not None:
+        raise error
+    return results
+
+
+class _RpcHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def log_message(self, format, *args):
+        pass
+
+    def _content_length(self):
+        """The request's Content-Length, or None if it is missing or not a valid length"""
+        try:
+            length = int(self.headers["Content-Length"])
+        except (TypeError, ValueError):
+            return None
+        return length if length >= 0 else None
+
+    def do_POST(self):
+        # POST /<method> with a JSON payload, or POST /<method>/batch with a JSON list
+        method, _, batch = self.path.strip("/").partition("/")
+        handler = self.server.methods.get(method)
+        length = self._content_length()
+        if length is None:
+            status, result = 400, {"error": {"type": "BadRequest", "message": "missing or invalid Content-Length"}}
+        elif handler is None:
+            self.rfile.read(length)  # consume the body so the next request parses
+            status, result = 404, {"error": {"type": "NotFound", "message": f"no method {method!r}"}}
+        else:
+            try:
+                payload = json.loads(self.rfile.read(length))
+                status, result = 200, [handler(p) for p in payload] if batch else handler(payload)
+            except Exception as e:
+                # Always answer: a pipelining client matches responses to requests by order
+                status, result = 500, {"error": {"type": type(e).__name__, "message": str(e)}}
+        body = json.dumps(result).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if length is None:
+            # The unread body can't be told apart from the next request: drop the connection
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _http_service_main(conn, service_name):
+    """Service process for HttpTransport: report the bound port, then serve forever"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RpcHandler)
+    server.daemon_threads = True
+    server.methods = _bind_methods(service_name)
+    conn.send(server.server_address[1])
+    server.serve_forever()
+
+
+class _HttpConnection:
+    """
+    Minimal keep-alive HTTP/1.1 client that supports pipelining.
+
+    http.client.HTTPConnection refuses a new request until the previous response has
+    been read, so requests are written and responses parsed directly on the socket.
+    """
+
+    def __init__(self, port):
+        self.sock = socket.create_connection(("127.0.0.1", port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.rfile = self.sock.makefile("rb")
+
+    def send(self, path, payload):
+        body = json.dumps(payload).encode()
+        head = (f"POST {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+        self.sock.sendall(head.encode() + body)
+
+    def receive(self):
+        status = int(self.rfile.readline().split()[1])
+        length = 0
+        while True:
+            line = self.rfile.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value)
+        result = json.loads(self.rfile.read(length))
+        if status != 200:
+            raise ServiceError(result["error"]["type"], result["error"]["message"])
+        return result
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+
+class HttpTransport(Transport):
+    """One HTTP server process per service, JSON over keep-alive localhost TCP"""
+
+    name = "http"
+
+    def __init__(self):
+        self._conns, self._processes = {}, []
+        for service_name in SERVICES:
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_http_service_main, args=(child, service_name), daemon=True)
+            process.start()
+            self._conns[service_name] = _HttpConnection(parent.recv())
+            self._processes.append(process)
+
+    def call(self, service, method, payload):
+        conn = self._conns[service]
+        conn.send(f"/{method}", payload)
+        return conn.receive()
+
+    def call_batch(self, service, method, payloads):
+        conn = self._conns[service]
+        conn.send(f"/{method}/batch", payloads)
+        return conn.receive()
+
+    def call_pipelined(self, service, method, payloads, depth):
+        conn = self._conns[service]
+        path = f"/{method}"
+        return _sliding_window(payloads, depth, lambda payload: conn.send(path, payload), conn.receive)
+
+    def close(self):
+        for conn in self._conns.values():
+            conn.close()
+        for process in self._processes:
+            process.terminate()
+            process.join()
+
+
+# === CHECKOUT WORKFLOW ===
+class ShoppingCart:
+    """The checkout from _behavioral_patterns.txt, talking to services through a transport"""
+
+    def __init__(self, transport):
+        self.transport = transport
+
+    def checkout(self, items, method):
+        amount = self.transport.call("cart", "total", items)
+        return self.transport.call("payment", "pay", {"amount": amount, "method": method})
+
+    def checkout_many(self, orders, mode="sequential", size=1):
+        """orders: [(items, method), ...]; mode: sequential | batch | pipeline"""
+        if mode == "sequential":
+            return [self.checkout(items, method) for items, method in orders]
+        transport = self.transport
+        if mode == "batch":
+            amounts = transport.call_batch("cart", "total", [items for items, _ in orders])
+            requests = [{"amount": a, "method": m} for a, (_, m) in zip(amounts, orders)]
+            return transport.call_batch("payment", "pay", requests)
+        if mode == "pipeline":
+            amounts = transport.call_pipelined("cart", "total", [items for items, _ in orders], size)
+            requests = [{"amount": a, "method": m} for a, (_, m) in zip(amounts, orders)]
+            return transport.call_pipelined("payment", "pay", requests, size)
+        raise ValueError(f"Unknown mode: {mode}")
+
+
+# === HARNESS ===
+def make_orders(count, seed=42):
+    rng = random.Random(seed)
+    skus = list(CartService.CATALOG)
+    return [([[sku, rng.randint(1, 3)] for sku in rng.sample(skus, rng.randint(1, 4))],
+             rng.choice(("card", "paypal"))) for _ in range(count)]
+
+
+def measure(transport, orders, mode, size):
+    """Run all orders in groups of `size`; returns (receipts, per-order latencies, seconds)"""
+    cart = ShoppingCart(transport)
+    group = 1 if mode == "sequential" else size
+    receipts, latencies = [], []
+    start = time.perf_counter()
+    for i in range(0, len(orders), group):
+        chunk = orders[i:i + group]
+        sent = time.perf_counter()
+        receipts.extend(cart.checkout_many(chunk, mode, size))
+        latencies.extend([time.perf_counter() - sent] * len(chunk))
+    return receipts, latencies, time.perf_counter() - start
+
+
+def run_benchmark(count=5_000, size=32, topologies=(DirectTransport, QueueTransport, HttpTransport)):
+    orders = make_orders(count)
+    modes = [("sequential", 1), ("batch", size), ("pipeline", size)]
+    print(f"{count:,} checkouts (2 service calls each), group size {size}")
+    print(f"{'topology':>9} {'mode':>12} {'orders/s':>11} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    expected = None
+    for topology in topologies:
+        transport = topology()
+        try:
+            measure(transport, orders[:100], "sequential", 1)  # warm up connections/processes
+            for mode, mode_size in modes:
+                receipts, latencies, elapsed = measure(transport, orders, mode, mode_size)
+                expected = expected or receipts
+                assert receipts == expected, f"{transport.name}/{mode} returned different receipts"
+                q = statistics.quantiles(latencies, n=100)
+                label = mode if mode == "sequential" else f"{mode}={mode_size}"
+                print(f"{transport.name:>9} {label:>12} {count / elapsed:>11,.0f} "
+                      f"{q[49] * 1000:>8.3f} {q[94] * 1000:>8.3f} {q[98] * 1000:>8.3f}")
+        finally:
+            transport.close()
+
+
+if __name__ == "__main__":
+    print("--- Same checkout, three topologies ---")
+    for topology in (DirectTransport, QueueTransport, HttpTransport):
+        transport = topology()
+        cart = ShoppingCart(transport)
+        print(f"{transport.name:>6}: {cart.checkout([['book', 2], ['pen', 4]], 'card')}")  # Paid $30.00 ...
+        try:
+            cart.checkout_many([([["book", 1]], "card"), ([["sofa", 1]], "card")], "pipeline", 2)
+        except ServiceError as e:
+            print(f"{'':>6}  unknown SKU -> ServiceError({e}), next call: "
+                  f"{cart.checkout([['mug', 1]], 'paypal')}")
+        transport.close()
+
+    print("\n--- Benchmark ---")
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
+
+"""
+USEFUL SERVICE-COMMUNICATION TOOLS AND EXAMPLES:
+
+Standard Library:
+- multiprocessing.Pipe(): Fast local IPC between two processes (pickled objects)
+- http.server.ThreadingHTTPServer + socket: Minimal HTTP services and clients
+- socket.TCP_NODELAY: Don't let Nagle's algorithm delay small request/response messages
+- statistics.quantiles(data, n=100): p50/p95/p99 from latency samples
+
+Production Equivalents:
+- gRPC (HTTP/2 multiplexing = pipelining without head-of-line blocking per request)
+- Message brokers: RabbitMQ, Kafka, NATS (queue topology across hosts)
+- Batch endpoints (POST /payments/batch), DataLoader-style request coalescing
+
+Notes:
+- A localhost hop is the best case; real networks add ~0.1-1 ms per hop in a data
+  center, more across zones, plus retries and timeouts
+- Batching amortizes per-message overhead (serialization, syscalls, headers) but makes
+  every order in a batch wait for the slowest one
+- Pipelining hides round trips without changing the API, but responses still come back
+  in order (head-of-line blocking in HTTP/1.1). It only helps when waiting dominates: the
+  stdlib HTTP server parses every request in Python, so here http is bound by server CPU
+  and pipelining barely changes throughput, while the cheaper queue transport gains
+- Start with a modular monolith; extract a service when the independence is worth the hop
+"""
@@ -0,0 +1,6 @@
+"""Design and database principles (SOLID, DRY, ACID...)."""
+
+from lazy_submodules import lazy_submodules
+
+__all__ = ["wal_kv_store_example"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
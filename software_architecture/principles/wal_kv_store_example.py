@@ -0,0 +1,574 @@
+"""
+Write-Ahead-Logged KV Store Concept (ACID from scratch):
+_ACID.txt describes atomicity, isolation and WAL durability as SQL prose. This is a small
+embedded key-value store that implements them, using the bank transfer from the doc:
+
+- Atomicity + Durability: a transaction's writes are encoded as ONE log record
+  (length + CRC32 + JSON) and appended to an append-only file. The commit returns only
+  after the record is fsync'ed. On restart the log is replayed; a torn record at the end
+  (crash in the middle of a write) fails its CRC and is dropped with everything after it,
+  so a transaction is either fully recovered or not at all.
+- Group commit: fsync is the expensive part (a disk round trip), and it costs about the
+  same for 1 record as for 100. Committers queue their records and one flusher thread
+  writes everything queued so far with a single fsync, optionally waiting up to
+  `group_commit_window` seconds to gather a bigger batch.
+- Isolation (MVCC snapshot isolation): each key keeps a list of (commit_ts, value)
+  versions. A transaction reads the newest version <= its start timestamp, so readers
+  never take the commit lock and never see uncommitted or half-committed data. Two
+  transactions writing the same key conflict: the first to commit wins, the other gets
+  ConflictError and is retried (first-committer-wins).
+- Consistency: enforced by the application inside the transaction (balance >= 0); raising
+  rolls back, and nothing reaches the log.
+- Compaction: the log only grows, so once it has grown by `compact_bytes` it is rewritten
+  as a checkpoint of the live values, and MVCC versions no snapshot can see are dropped.
+"""
+
+import json
+import os
+import random
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+
+_HEADER = struct.Struct("<II")  # payload length, CRC32 of payload
+_CHECKPOINT_CHUNK = 1000        # keys per checkpoint record
+
+
+class ConflictError(Exception):
+    """Another transaction committed a write to the same key after our snapshot"""
+
+    def __init__(self, message, commit_ts=0):
+        super().__init__(message)
+        self.commit_ts = commit_ts  # the conflicting commit
+
+
+class TransactionClosed(Exception):
+    pass
+
+
+def encode_record(ts, writes):
+    payload = json.dumps({"ts": ts, "w": writes}, separators=(",", ":")).encode()
+    return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def read_records(f):
+    """Yield (end_offset, record) for each intact record; stops at the first torn one"""
+    offset = 0
+    while True:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return
+        length, crc = _HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            return
+        offset += _HEADER.size + length
+        yield offset, json.loads(payload)
+
+
+def _check_key(key):
+    # Keys must come back from the JSON log unchanged: a tuple key would be replayed as an
+    # (unhashable) list, and 1 vs "1" vs 1.0 are easy to mix up
+    if not isinstance(key, str):
+        raise TypeError(f"keys must be str, got {type(key).__name__}")
+
+
+# === TRANSACTION ===
+class Transaction:
+    """Reads from a snapshot, buffers writes locally until commit()"""
+
+    __slots__ = ("_store", "start_ts", "_writes", "_closed")
+
+    def __init__(self, store, start_ts):
+        self._store = store
+        self.start_ts = start_ts
+        self._writes = {}
+        self._closed = False
+
+    def get(self, key, default=None):
+        if key in self._writes:  # read your own writes
+            value = self._writes[key]
+            return default if value is None else value
+        return self._store._read(key, self.start_ts, default)
+
+    def put(self, key, value):
+        if self._closed:
+            raise TransactionClosed("transaction already finished")
+        _check_key(key)
+        if value is None:
+            raise ValueError("None is reserved for deletes; use delete()")
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError) as e:
+            raise TypeError(f"value for {key!r} can't be written to the log: {e}") from None
+        self._writes[key] = value
+
+    def delete(self, key):
+        if self._closed:
+            raise TransactionClosed("transaction already finished")
+        _check_key(key)
+        self._writes[key] = None
+
+    def commit(self):
+        if self._closed:
+            raise TransactionClosed("transaction already finished")
+        self._closed = True
+        try:
+            return self._store._commit(self.start_ts, self._writes)
+        finally:
+            self._store._end_snapshot(self.start_ts)
+
+    def rollback(self):
+        if not self._closed:
+            self._closed = True
+            self._writes.clear()
+            self._store._end_snapshot(self.start_ts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+# === STORE ===
+class KVStore:
+    """
+    Embedded transactional key-value store backed by a write-ahead log.
+
+    Args:
+        path: Log file; created if missing, replayed if present.
+        group_commit_window: None fsyncs inside every commit (one fsync per transaction).
+            A number enables group commit: a flusher thread fsyncs whatever is queued,
+            waiting up to this many seconds after the first queued record (0 = don't wait,
+            batch only what queued up during the previous fsync).
+        max_batch: Flush early once this many records are queued.
+        compact_bytes: Compact after the log grows by this much (None = only on demand).
+    """
+
+    def __init__(self, path, group_commit_window=0.0, max_batch=1024, compact_bytes=64 << 20):
+        self.path = path
+        self.group_commit_window = group_commit_window
+        self.max_batch = max_batch
+        self.compact_bytes = compact_bytes
+        self._versions = {}              # key -> [(commit_ts, value), ...] oldest first
+        self._lock = threading.Lock()     # serializes commit validation and log order
+        self._cond = threading.Condition(self._lock)
+        self._snapshots = Counter()       # start_ts -> active transactions
+        self._snapshot_lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._pending = []                # encoded records waiting for fsync, in commit order
+        self._last_ts = 0                 # last assigned commit timestamp
+        self._durable_ts = 0              # last commit timestamp known to be on disk
+        self._visible_ts = 0              # new snapshots start here
+        self._flush_error = None
+        self._closing = False
+        self.stats = Counter()
+        self._recover()
+        self._file = open(path, "ab", buffering=0)
+        self._flusher = None
+        if group_commit_window is not None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="wal-flusher", daemon=True)
+            self._flusher.start()
+
+    # --- Recovery ---
+    def _recover(self):
+        if not os.path.exists(self.path):
+            self._log_bytes = self._checkpoint_bytes = 0
+            return
+        good_offset = 0
+        with open(self.path, "rb") as f:
+            for good_offset, record in read_records(f):
+                ts = record["ts"]
+                for key, value in record["w"]:
+                    self._versions[key] = [(ts, value)]  # only the latest survives a restart
+                self._last_ts = max(self._last_ts, ts)
+                self.stats["recovered_records"] += 1
+        if good_offset < os.path.getsize(self.path):
+            # Torn/corrupt tail from a crash: those commits were never acknowledged
+            self.stats["truncated_bytes"] = os.path.getsize(self.path) - good_offset
+            with open(self.path, "r+b") as f:
+                f.truncate(good_offset)
+                os.fsync(f.fileno())
+        for key in [k for k, versions in self._versions.items() if versions[-1][1] is None]:
+            del self._versions[key]
+        self._durable_ts = self._visible_ts = self._last_ts
+        self._log_bytes = self._checkpoint_bytes = good_offset
+
+    # --- Reads ---
+    def transaction(self):
+        with self._snapshot_lock:
+            start_ts = self._visible_ts
+            self._snapshots[start_ts] += 1
+        return Transaction(self, start_ts)
+
+    def get(self, key, default=None):
+        """Read the latest committed value (a one-off snapshot read)"""
+        return self._read(key, self._visible_ts, default)
+
+    def _read(self, key, ts, default):
+        versions = self._versions.get(key)
+        if versions is None:
+            return default
+        # Usually the newest version is visible; otherwise walk back (lists are short)
+        for commit_ts, value in reversed(versions):
+            if commit_ts <= ts:
+                return default if value is None else value
+        return default
+
+    def _end_snapshot(self, ts):
+        with self._snapshot_lock:
+            self._snapshots[ts] -= 1
+            if not self._snapshots[ts]:
+                del self._snapshots[ts]
+
+    # --- Commit ---
+    def _commit(self, start_ts, writes):
+        if not writes:
+            return self._visible_ts  # read-only: nothing to log
+        with self._lock:
+            if self._flush_error is not None:
+                raise self._flush_error
+            versions = self._versions
+            for key in writes:
+                history = versions.get(key)
+                if history and history[-1][0] > start_ts:
+                    self.stats["conflicts"] += 1
+                    raise ConflictError(f"{key!r} was modified by a concurrent transaction", history[-1][0])
+            # Encode before taking the timestamp: if encoding fails, nothing has changed
+            ts = self._last_ts + 1
+            record = encode_record(ts, list(writes.items()))
+            if self._flusher is None:
+                # The lock is held throughout, so the record can be made durable before
+                # anything changes in memory
+                try:
+                    self._write_batch([record])
+                except OSError as e:
+                    # Part of the record may be on disk: the outcome is unknown until a
+                    # restart replays (or drops) it, so refuse further commits, like the flusher
+                    self._flush_error = e
+                    raise
+            self._last_ts = ts
+            # Installed now so later committers see the conflict, but invisible to
+            # readers until _visible_ts reaches ts (after the fsync)
+            for key, value in writes.items():
+                versions.setdefault(key, []).append((ts, value))
+            if self._flusher is None:
+                self._durable_ts = self._visible_ts = ts
+            else:
+                self._pending.append(record)
+                self._cond.notify_all()
+                while self._durable_ts < ts and self._flush_error is None:
+                    self._cond.wait()
+                if self._durable_ts < ts:
+                    raise self._flush_error
+            self.stats["commits"] += 1
+        if self.compact_bytes is not None and self._log_bytes - self._checkpoint_bytes > self.compact_bytes:
+            self.compact(blocking=False)
+        return ts
+
+    def _write_batch(self, records):
+        data = b"".join(records)
+        view = memoryview(data)
+        while view:  # unbuffered FileIO.write may write less than asked
+            view = view[self._file.write(view):]
+        os.fsync(self._file.fileno())
+        self._log_bytes += len(data)
+        self.stats["fsyncs"] += 1
+        self.stats["records"] += len(records)
+
+    def _flush_loop(self):
+        cond = self._cond
+        while True:
+            with cond:
+                while not self._pending and not self._closing:
+                    cond.wait()
+                if not self._pending:
+                    return
+                if self.group_commit_window:
+                    deadline = time.monotonic() + self.group_commit_window
+                    while len(self._pending) < self.max_batch and not self._closing:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        cond.wait(remaining)
+                batch, self._pending = self._pending, []
+                batch_ts = self._last_ts  # records are queued in commit_ts order
+            # Committers keep queueing the next batch while this one is fsync'ed
+            try:
+                self._write_batch(batch)
+            except OSError as e:
+                with cond:
+                    self._flush_error = e
+                    cond.notify_all()
+                return
+            with cond:
+                self._durable_ts = self._visible_ts = batch_ts
+                cond.notify_all()
+
+    def run(self, func, *args, retries=100):
+        """Run func(tx, *args) in a transaction, retrying on write-write conflicts"""
+        for _ in range(retries):
+            tx = self.transaction()
+            try:
+                with tx:
+                    result = func(tx, *args)
+                return result
+            except ConflictError as e:
+                # A new snapshot only sees the winner once it is durable; retrying
+                # before that would just conflict again
+                self._wait_visible(e.commit_ts)
+        raise ConflictError(f"gave up after {retries} conflicts")
+
+    def _wait_visible(self, ts):
+        with self._cond:
+            self.stats["retries"] += 1
+            while self._visible_ts < ts and self._flush_error is None:
+                self._cond.wait()
+
+    # --- Compaction ---
+    def compact(self, blocking=True):
+        """
+        Rewrite the log as a checkpoint of live values and drop old MVCC versions.
+
+        Commits are paused while the checkpoint is written (readers are not).
+        """
+        if not self._compact_lock.acquire(blocking):
+            return False
+        try:
+            with self._lock:
+                while self._durable_ts < self._last_ts and self._flush_error is None:
+                    self._cond.wait()  # let the flusher drain the queue first
+                ts = self._last_ts
+                with self._snapshot_lock:
+                    oldest = min(self._snapshots, default=ts)
+                self._prune_versions(oldest)
+                live = [(key, versions[-1][1]) for key, versions in self._versions.items()
+                        if versions[-1][1] is not None]
+                tmp_path = self.path + ".compact"
+                with open(tmp_path, "wb") as f:
+                    for i in range(0, len(live), _CHECKPOINT_CHUNK):
+                        f.write(encode_record(ts, live[i:i + _CHECKPOINT_CHUNK]))
+                    f.flush()
+                    os.fsync(f.fileno())
+                    size = f.tell()
+                self._file.close()
+                os.replace(tmp_path, self.path)  # atomic: old log or new checkpoint, never half
+                _fsync_dir(self.path)
+                self._file = open(self.path, "ab", buffering=0)
+                self.stats["compactions"] += 1
+                self._log_bytes = self._checkpoint_bytes = size
+            return True
+        finally:
+            self._compact_lock.release()
+
+    def _prune_versions(self, oldest_ts):
+        """Keep the newest version <= oldest_ts (some snapshot may read it) and newer ones"""
+        versions = self._versions
+        for key in list(versions):
+            history = versions[key]
+            keep = 0
+            for i in range(len(history) - 1, -1, -1):
+                if history[i][0] <= oldest_ts:
+                    keep = i
+                    break
+            if keep == len(history) - 1 and history[-1][1] is None and history[-1][0] <= oldest_ts:
+                del versions[key]  # deleted and no snapshot can still see it
+            elif keep:
+                versions[key] = history[keep:]  # new list: readers holding the old one are fine
+
+    def close(self):
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _fsync_dir(path):
+    """Make a rename durable (POSIX); directories can't be opened on Windows"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# === BANK TRANSFER FROM _ACID.txt ===
+class InsufficientFundsError(Exception):
+    pass
+
+
+def open_accounts(store, count, balance):
+    with store.transaction() as tx:
+        for i in range(count):
+            tx.put(f"acct:{i}", balance)
+
+
+def transfer(tx, from_account, to_account, amount):
+    balance = tx.get(from_account)
+    if balance < amount:
+        raise InsufficientFundsError(f"{from_account} has {balance}, needs {amount}")  # consistency
+    tx.put(from_account, balance - amount)
+    tx.put(to_account, tx.get(to_account) + amount)
+
+
+def total_balance(store, count):
+    with store.transaction() as tx:  # one consistent snapshot across all accounts
+        return sum(tx.get(f"acct:{i}") for i in range(count))
+
+
+def _crashing_worker(path, accounts):
+    """Child process: transfer money until it is killed with SIGKILL"""
+    store = KVStore(path, group_commit_window=0.001)
+    rng = random.Random()
+    while True:
+        a, b = rng.sample(range(accounts), 2)
+        try:
+            store.run(transfer, f"acct:{a}", f"acct:{b}", rng.randint(1, 50))
+        except InsufficientFundsError:
+            pass
+
+
+# === BENCHMARK ===
+def run_benchmark(transactions=4_000, threads=32, accounts=1_000,
+                  windows=(None, 0.0, 0.0005, 0.002, 0.01)):
+    print(f"{transactions:,} bank transfers, {threads} threads, {accounts:,} accounts")
+    print(f"{'group commit window':>20} {'commits/s':>10} {'fsyncs':>7} {'txn/fsync':>10} "
+          f"{'p50 ms':>7} {'p99 ms':>7} {'retries':>8}")
+    for window in windows:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = KVStore(os.path.join(tmp, "bank.wal"), group_commit_window=window)
+            open_accounts(store, accounts, 1_000)
+            store.stats.clear()
+            per_thread = transactions // threads
+            latencies = []
+
+            def client(seed):
+                rng = random.Random(seed)
+                local = []
+                for _ in range(per_thread):
+                    a, b = rng.sample(range(accounts), 2)
+                    start = time.perf_counter()
+                    try:
+                        store.run(transfer, f"acct:{a}", f"acct:{b}", rng.randint(1, 100))
+                    except InsufficientFundsError:
+                        pass
+                    local.append(time.perf_counter() - start)
+                latencies.extend(local)
+
+            workers = [threading.Thread(target=client, args=(seed,)) for seed in range(threads)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+            assert total_balance(store, accounts) == accounts * 1_000
+            store.close()
+
+        latencies.sort()
+        stats = store.stats
+        label = "fsync per commit" if window is None else f"{window * 1000:g} ms"
+        print(f"{label:>20} {stats['commits'] / elapsed:>10,.0f} {stats['fsyncs']:>7,} "
+              f"{stats['records'] / max(stats['fsyncs'], 1):>10.1f} "
+              f"{latencies[len(latencies) // 2] * 1000:>7.2f} {latencies[int(len(latencies) * 0.99)] * 1000:>7.2f} "
+              f"{stats['retries']:>8,}")
+
+
+if __name__ == "__main__":
+    import multiprocessing
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bank.wal")
+
+        print("--- Atomicity and consistency ---")
+        with KVStore(path) as store:
+            open_accounts(store, 2, 500)
+            store.run(transfer, "acct:0", "acct:1", 100)
+            try:
+                store.run(transfer, "acct:0", "acct:1", 1_000)
+            except InsufficientFundsError as e:
+                print(f"rolled back: {e}")
+            print(store.get("acct:0"), store.get("acct:1"))  # 400 600
+
+            print("\n--- Snapshot isolation ---")
+            reader = store.transaction()
+            store.run(transfer, "acct:0", "acct:1", 50)
+            print(f"old snapshot: {reader.get('acct:0')}, latest: {store.get('acct:0')}")  # 400, 350
+            reader.commit()
+
+            t1, t2 = store.transaction(), store.transaction()
+            transfer(t1, "acct:0", "acct:1", 10)
+            transfer(t2, "acct:0", "acct:1", 20)
+            t1.commit()
+            try:
+                t2.commit()
+            except ConflictError as e:
+                print(f"second writer: ConflictError ({e})")
+
+        print("\n--- Crash recovery (SIGKILL in the middle of transfers) ---")
+        with KVStore(path) as store:
+            open_accounts(store, 100, 1_000)
+        child = multiprocessing.Process(target=_crashing_worker, args=(path, 100))
+        child.start()
+        time.sleep(1.0)
+        child.kill()
+        child.join()
+        with open(path, "ab") as f:
+            f.write(encode_record(10 ** 9, [["acct:0", 10 ** 6]])[:-5])  # simulate a torn write
+        with KVStore(path, compact_bytes=None) as store:
+            print(f"replayed {store.stats['recovered_records']:,} records, "
+                  f"dropped {store.stats['truncated_bytes']} torn bytes")
+            print(f"total balance: {total_balance(store, 100):,} (expected 100,000)")
+            before = os.path.getsize(path)
+            store.compact()
+            print(f"compaction: {before:,} -> {os.path.getsize(path):,} bytes")
+        with KVStore(path) as store:
+            print(f"after compaction + restart: {total_balance(store, 100):,}")
+
+    print("\n--- Benchmark ---")
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 4_000)
+
+"""
+USEFUL DURABILITY TOOLS AND EXAMPLES:
+
+Standard Library:
+- os.fsync(fd): Force written data to stable storage (file.flush() alone is not enough)
+- os.replace(tmp, path) + fsync of the directory: Atomic file swap
+- zlib.crc32 / struct.pack: Detect torn or corrupt log records
+- multiprocessing.Process.kill(): SIGKILL a child to test crash recovery for real
+- sqlite3: A real embedded ACID database (PRAGMA journal_mode=WAL)
+
+Design Notes:
+- Commit = "the log record is durable"; data files/checkpoints can be written later
+- Group commit trades a little latency per transaction for many more commits per fsync
+- Snapshot isolation allows write skew (two transactions reading A+B and each updating one);
+  SERIALIZABLE needs read-set validation or locking
+- fsync latency ranges from microseconds (NVMe with power-loss protection) to
+  milliseconds (consumer disks) - measure on the target hardware
+
+Real-World Examples:
+1. PostgreSQL WAL + commit_delay/commit_siblings (group commit)
+2. RocksDB/LevelDB: WAL + memtable + compaction of sorted files
+3. Kafka: append-only segments, fsync batched by flush.messages / flush.ms
+"""
@@ -0,0 +1,191 @@
+"""
+Import-Time Profiler:
+Measures the cold-start cost of importing every module in the repository's packages,
+using the interpreter's own instrumentation (python -X importtime). Each module is imported
+in a fresh interpreter, several times, and the fastest run is kept, because the
+slower runs are mostly noise from other processes on the machine.
+
+For each module it reports the cumulative import time (the module plus everything it
+imports that wasn't already loaded at startup), its own "self" time, and its heaviest
+direct dependencies. With --check it fails (exit code 1) when:
+
+- a module got slower than the baseline by more than --tolerance (relative) plus
+  --slack-ms (absolute, so sub-millisecond modules don't fail on noise)
+- a module is slower than --budget-ms
+- importing a module prints anything (a demo running outside `if __name__ == "__main__":`)
+- a module is missing from its package's __all__ (it wouldn't be lazily importable)
+
+Usage (from the repository root):
+    python tools/import_profiler.py                      # report
+    python tools/import_profiler.py --check              # compare with tools/import_baseline.json
+    python tools/import_profiler.py --save-baseline      # accept the current numbers
+    python tools/import_profiler.py leetcode.Two_Sum -r 10
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "tools", "import_baseline.json")
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def discover_modules(root=ROOT):
+    """Dotted names of every package and module reachable through __init__.py files"""
+    modules = []
+    for top in sorted(os.listdir(root)):
+        if not os.path.isfile(os.path.join(root, top, "__init__.py")):
+            continue
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, top)):
+            if "__init__.py" not in filenames:
+                dirnames[:] = []
+                continue
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "__")))
+            package = os.path.relpath(dirpath, root).replace(os.sep, ".")
+            modules.append(package)
+            modules += [f"{package}.{name[:-3]}" for name in sorted(filenames)
+                        if name.endswith(".py") and name not in ("__init__.py", "__main__.py")]
+    return modules
+
+
+def missing_from_all(module, root=ROOT):
+    """True if `module` isn't listed in its parent package's __all__"""
+    parent, _, name = module.rpartition(".")
+    if not parent:
+        return False
+    result = subprocess.run([sys.executable, "-c", f"import {parent}; print({parent}.__all__)"],
+                            cwd=root, capture_output=True, text=True)
+    return result.returncode != 0 or repr(name) not in result.stdout
+
+
+def profile_import(module, repeat=3, root=ROOT):
+    """
+    Import `module` in `repeat` fresh interpreters.
+
+    Returns a dict with cumulative/self time in microseconds (fastest run), the heaviest
+    direct dependencies, and whatever the import printed.
+    """
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="")  # let the warm-up run write .pyc files
+    subprocess.run(command, cwd=root, capture_output=True, env=env)  # warm-up: compile to __pycache__
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(command, cwd=root, capture_output=True, text=True, env=env)
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()
+            return {"error": error[-1] if error else f"exit code {result.returncode}"}
+        run = _parse_importtime(result.stderr, module)
+        run["stdout"] = result.stdout
+        if best is None or run["cumulative"] < best["cumulative"]:
+            best = run
+    return best
+
+
+def _parse_importtime(stderr, module):
+    entries = []  # (self_us, cumulative_us, depth, name) in the order they finished
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((int(self_us), int(cumulative_us), len(indent) // 2, name))
+    # Nested imports finish before their importer, so the target's own entry (depth 0)
+    # comes after everything it pulled in; children at depth 1 directly precede it
+    for index in range(len(entries) - 1, -1, -1):
+        self_us, cumulative_us, depth, name = entries[index]
+        if name == module and depth == 0:
+            break
+    else:
+        return {"cumulative": 0, "self": 0, "deps": []}
+    children = []
+    for child_self, child_cumulative, child_depth, child_name in reversed(entries[:index]):
+        if child_depth == 0:
+            break
+        if child_depth == 1:
+            children.append((child_cumulative, child_name))
+    children.sort(reverse=True)
+    return {"cumulative": cumulative_us, "self": self_us, "deps": children[:3]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile per-module import time with -X importtime")
+    parser.add_argument("modules", nargs="*", help="dotted module names (default: all)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="runs per module, fastest kept")
+    parser.add_argument("--check", action="store_true", help="fail on regressions, noisy imports, missing __all__")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative slowdown (0.5 = +50%%)")
+    parser.add_argument("--slack-ms", type=float, default=5.0, help="allowed absolute slowdown in ms")
+    parser.add_argument("--budget-ms", type=float, default=None, help="hard limit per module in ms")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or discover_modules()
+    baseline = {}
+    if args.check and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    failures = []
+    results = {}
+    width = max(len(module) for module in modules)
+    print(f"{'module':{width}} {'cumul ms':>9} {'self ms':>8} {'baseline':>9}  heaviest imports")
+    for module in modules:
+        result = profile_import(module, args.repeat)
+        if "error" in result:
+            failures.append(f"{module}: import failed: {result['error']}")
+            print(f"{module:{width}} {'ERROR':>9}  {result['error']}")
+            continue
+        results[module] = result["cumulative"]
+        ms = result["cumulative"] / 1000
+        deps = ", ".join(f"{name} {us / 1000:.1f}" for us, name in result["deps"])
+        before = baseline.get(module)
+        print(f"{module:{width}} {ms:>9.2f} {result['self'] / 1000:>8.2f} "
+              f"{before / 1000 if before is not None else float('nan'):>9.2f}  {deps}")
+        if not args.check:
+            continue
+        if result["stdout"]:
+            failures.append(f"{module}: prints on import ({result['stdout'].splitlines()[0]!r}...)")
+        if before is not None and ms > before / 1000 * (1 + args.tolerance) + args.slack_ms:
+            failures.append(f"{module}: {ms:.2f} ms, baseline {before / 1000:.2f} ms")
+        if args.budget_ms is not None and ms > args.budget_ms:
+            failures.append(f"{module}: {ms:.2f} ms exceeds the {args.budget_ms:g} ms budget")
+        if missing_from_all(module):
+            failures.append(f"{module}: not listed in its package's __all__")
+
+    if args.save_baseline:
+        if args.modules and os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                results = {**json.load(f), **results}
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nSaved baseline for {len(results)} modules to {os.path.relpath(args.baseline, ROOT)}")
+
+    total = sum(results.values()) / 1000
+    print(f"\n{len(results)} modules, {total:.1f} ms of imports (each measured in a fresh interpreter)")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+"""
+USEFUL IMPORT-TIME TOOLS AND EXAMPLES:
+
+Measuring:
+- python -X importtime -c "import module": Per-import self/cumulative microseconds (stderr)
+- PYTHONPROFILEIMPORTTIME=1: Same, through the environment
+- tuna: Visualize -X importtime output as an icicle chart (pip install tuna)
+- python -X importtime -c pass: What the interpreter itself loads at startup
+
+Reducing:
+- Guard demos with if __name__ == "__main__": so importing a module only defines things
+- Module __getattr__ (PEP 562): Import submodules on first attribute access
+- Import heavy modules inside the function that needs them
+- importlib.util.LazyLoader: Defer executing a module until an attribute is used
+"""